@@ -0,0 +1,169 @@
+import threading
+import time
+
+import pygame
+
+
+class AssetManager:
+    """
+    Loads every image and sound file once and hands out shared surfaces.
+
+    Images are converted to the display's pixel format as soon as a display
+    exists, and scaled / flipped variants are cached by
+    (path, size, flip_x, smooth, alpha) so sprites never touch the disk or
+    the scaler after the first request. Collision masks are cached per
+    image the same way.
+    """
+
+    def __init__(self):
+        self._files = {}
+        self._variants = {}
+        self._masks = {}
+        self._sounds = {}
+
+    def _load(self, path, alpha, fallback):
+        key = (path, alpha)
+        image = self._files.get(key)
+        if image is None:
+            try:
+                image = pygame.image.load(path)
+            except Exception:
+                if fallback is None:
+                    raise
+                # Placeholder so a missing file doesn't stop the game
+                image = pygame.Surface((1, 1), pygame.SRCALPHA)
+                image.fill(fallback)
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha() if alpha else image.convert()
+            self._files[key] = image
+        return image
+
+    def image(self, path, size=None, flip_x=False, smooth=False, alpha=True, fallback=None):
+        """
+        Return the image at `path`, optionally scaled to `size` and mirrored
+        horizontally. `alpha=False` is for opaque art (backgrounds) and blits
+        faster. `fallback` is an RGB(A) color used if the file can't be loaded.
+        """
+        key = (path, size, flip_x, smooth, alpha)
+        image = self._variants.get(key)
+        if image is None:
+            image = self._load(path, alpha, fallback)
+            if size is not None and image.get_size() != size:
+                scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+                image = scale(image, size)
+            if flip_x:
+                image = pygame.transform.flip(image, True, False)
+            self._variants[key] = image
+        return image
+
+    def mask(self, image):
+        """Pixel-collision mask of a surface from `image()`, built once per surface."""
+        mask = self._masks.get(image)
+        if mask is None:
+            mask = self._masks[image] = pygame.mask.from_surface(image)
+        return mask
+
+    def sound(self, path):
+        sound = self._sounds.get(path)
+        if sound is None:
+            sound = pygame.mixer.Sound(path)
+            self._sounds[path] = sound
+        return sound
+
+    def clear(self):
+        self._files.clear()
+        self._variants.clear()
+        self._masks.clear()
+        self._sounds.clear()
+
+
+class AssetLoader:
+    """
+    Runs loading jobs on a worker thread, in the order they were added,
+    so the main thread can keep drawing (a splash, a progress bar) while
+    images decode and scale.
+
+    Jobs are named callables; their results are kept by name. `ready` and
+    `result` tell the main thread what it can use already, `wait` blocks
+    for a job and `cancel` drops one that is no longer wanted. A job that raises stops the loader and the error is raised
+    again in the main thread by `ready`, `result` or `wait`.
+
+    The registry's caches are plain dicts, so the worker and the main
+    thread may both fill them; at worst an image is loaded twice.
+    """
+
+    def __init__(self):
+        self.jobs = []
+        self.results = {}
+        self.timings = {}  # name -> seconds the job took
+        self.error = None
+        self._done = threading.Condition()
+        self._running = None  # Name of the job in progress
+        self._thread = None
+
+    def add(self, name, job):
+        self.jobs.append((name, job))
+
+    def cancel(self, name):
+        """Skip job `name` if it hasn't started; its result is None."""
+        with self._done:
+            if name not in self.results and name != self._running:
+                self.results[name] = None
+                self._done.notify_all()
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, name="asset-loader", daemon=True)
+        self._thread.start()
+
+    def run(self):
+        """Run the jobs left; also usable without a thread, for eager loading."""
+        for name, job in self.jobs:
+            with self._done:
+                if name in self.results:
+                    continue  # Cancelled
+                self._running = name
+            start = time.perf_counter()
+            try:
+                result = job()
+            except BaseException as e:
+                with self._done:
+                    self.error = e
+                    self._running = None
+                    self._done.notify_all()
+                return
+            with self._done:
+                self.timings[name] = time.perf_counter() - start
+                self.results[name] = result
+                self._running = None
+                self._done.notify_all()
+
+    def progress(self, *names):
+        """Fraction of `names` (default: every job) finished, 0..1."""
+        names = names or [name for name, _ in self.jobs]
+        return sum(name in self.results for name in names) / len(names) if names else 1.0
+
+    def _check(self):
+        if self.error is not None:
+            raise self.error
+
+    def _finished(self, names):
+        names = names or [name for name, _ in self.jobs]
+        return all(name in self.results for name in names)
+
+    def ready(self, *names):
+        """Have all of `names` (default: every job) finished?"""
+        self._check()
+        return self._finished(names)
+
+    def result(self, name):
+        self._check()
+        return self.results[name]
+
+    def wait(self, *names, timeout=None):
+        with self._done:
+            self._done.wait_for(lambda: self.error is not None or self._finished(names), timeout)
+        self._check()
+
+
+# Shared registry used by sprites and the game
+assets = AssetManager()
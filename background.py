@@ -0,0 +1,44 @@
+class BackgroundLayer:
+    """
+    A vertically tiling background image. `parallax` scales how fast it
+    scrolls with the camera (1.0 = with the level, 0.5 = half speed) and
+    `origin_y` is where the image's top edge sits at camera offset 0.
+    """
+
+    def __init__(self, image, parallax=1.0, origin_y=0):
+        self.image = image
+        self.parallax = parallax
+        self.origin_y = origin_y
+
+    def draw(self, surface, camera_offset):
+        height = self.image.get_height()
+        view_width, view_height = surface.get_size()
+        top = self.origin_y + camera_offset * self.parallax
+
+        # Source row that lands on screen row 0, then copy only the visible
+        # band, wrapping to the top of the image when it runs out.
+        src_y = int(-top) % height
+        dest_y = 0
+        while dest_y < view_height:
+            rows = min(height - src_y, view_height - dest_y)
+            surface.blit(self.image, (0, dest_y), (0, src_y, view_width, rows))
+            dest_y += rows
+            src_y = 0
+
+
+class BackgroundRenderer:
+    """Draws a stack of background layers, back to front."""
+
+    def __init__(self, image=None, origin_y=0):
+        self.layers = []
+        if image is not None:
+            self.add_layer(image, origin_y=origin_y)
+
+    def add_layer(self, image, parallax=1.0, origin_y=0):
+        layer = BackgroundLayer(image, parallax, origin_y)
+        self.layers.append(layer)
+        return layer
+
+    def draw(self, surface, camera_offset):
+        for layer in self.layers:
+            layer.draw(surface, camera_offset)
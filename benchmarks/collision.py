@@ -0,0 +1,85 @@
+"""
+Kitty-vs-platform collision benchmark: linear sprite-group sweeps vs the
+spatial.SpatialGrid broadphase, for growing platform counts.
+
+    python benchmarks/collision.py --counts 10 100 1000 10000
+"""
+import random
+import time
+
+import common  # Headless SDL and repo root on sys.path; keep first
+import pygame
+from constants import *
+from level_utils import generate_platforms
+from spatial import SpatialGrid
+from sprites import Platform
+
+
+def build_level(count):
+    branch = pygame.Surface((200, 20))
+    data, _ = generate_platforms(count, SCREEN_WIDTH, SCREEN_HEIGHT)
+    return [Platform(p, branch) for p in data]
+
+
+def probes(platforms, n):
+    """Kitty-sized rects placed on and between random platforms."""
+    rects = []
+    for _ in range(n):
+        p = random.choice(platforms)
+        rects.append(pygame.Rect(p.rect.x, p.rect.top - random.randint(0, 150), 100, 100))
+    return rects
+
+
+def time_per_query(fn, rects, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for rect in rects:
+            fn(rect)
+    return (time.perf_counter() - start) * 1e6 / (repeat * len(rects))
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'platforms':>10} {'group us':>9} {'grid us':>8} {'sway us':>8}")
+    for count in args.counts:
+        platforms = build_level(count)
+        group = pygame.sprite.Group(platforms)
+        grid = SpatialGrid()
+        for p in platforms:
+            grid.insert(p)
+        rects = probes(platforms, args.queries)
+        repeat = max(1, 2000 // count)
+
+        probe = pygame.sprite.Sprite()
+
+        def group_query(rect):
+            # What World.step did before: spritecollide + check_falling sweep
+            probe.rect = rect
+            pygame.sprite.spritecollide(probe, group, False)
+            pygame.sprite.spritecollideany(probe, group)
+
+        def grid_query(rect):
+            grid.query_rect(rect)
+            grid.any_rect(rect)
+
+        group_us = time_per_query(group_query, rects, repeat)
+        grid_us = time_per_query(grid_query, rects, repeat)
+
+        # Incremental index maintenance while every platform sways a little
+        start = time.perf_counter()
+        for p in platforms:
+            p.rect.y += random.choice((-3, 3))
+            grid.update(p)
+        sway_us = (time.perf_counter() - start) * 1e6 / count
+
+        print(f"{count:>10} {group_us:>9.2f} {grid_us:>8.2f} {sway_us:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Shared setup for the benchmark scripts: headless SDL drivers, the repo root
+on sys.path, and a surface allocation counter.
+"""
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import pygame
+
+
+class SurfaceAllocCounter:
+    """Counts surfaces created by pygame.transform while active."""
+
+    FUNCTIONS = ("flip", "scale", "smoothscale", "rotate", "rotozoom")
+
+    def __init__(self):
+        self.count = 0
+        self._originals = {}
+
+    def __enter__(self):
+        for name in self.FUNCTIONS:
+            original = getattr(pygame.transform, name)
+            self._originals[name] = original
+            setattr(pygame.transform, name, self._wrap(original))
+        return self
+
+    def __exit__(self, *exc):
+        for name, original in self._originals.items():
+            setattr(pygame.transform, name, original)
+
+    def _wrap(self, original):
+        def counted(*args, **kwargs):
+            self.count += 1
+            return original(*args, **kwargs)
+        return counted
@@ -0,0 +1,55 @@
+"""
+Enemy update benchmark: surface allocations and time per frame for dogs and
+an eagle at difficulty 3.
+
+    python benchmarks/enemies.py --dogs 3 --frames 600
+"""
+import time
+
+from common import SurfaceAllocCounter  # Also sets up headless SDL; keep first
+import pygame
+from constants import *
+from sprites import Dog, Eagle
+from world import World
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--dogs", type=int, default=3)
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    world = World(level=5, difficulty=3)
+    # Put dogs on the candidate platforms directly (normal spawning waits
+    # until they are off screen) and half of them facing left.
+    platforms = list(world.dog_spawns) or world.platforms.sprites()
+    for i in range(args.dogs):
+        dog = Dog(platforms[i % len(platforms)])
+        dog.direction = -1 if i % 2 else 1
+        world.dogs.add(dog)
+    eagle = Eagle(world.kitty)
+    world.eagles.add(eagle)
+
+    with SurfaceAllocCounter() as counter:
+        start = time.perf_counter()
+        for _ in range(args.frames):
+            for dog in world.dogs:
+                dog.update(FIXED_DT)
+            for eagle in world.eagles:
+                eagle.update(FIXED_DT)
+            if not world.eagles:
+                world.eagles.add(Eagle(world.kitty))
+        elapsed = time.perf_counter() - start
+
+    print(f"dogs: {args.dogs}, frames: {args.frames}")
+    print(f"surface allocations per frame: {counter.count / args.frames:.3f}")
+    print(f"enemy update time per frame: {elapsed * 1e6 / args.frames:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
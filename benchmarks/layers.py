@@ -0,0 +1,73 @@
+"""
+Sprite drawing benchmark: the old loop over every sprite in the level (a
+visibility test and a blit call each) vs renderer.SpriteLayer, which asks
+the spatial index for what is on screen and submits it in one blits call.
+
+    python benchmarks/layers.py --counts 10 100 1000 10000
+"""
+import time
+
+import common  # Headless SDL and repo root on sys.path; keep first
+import pygame
+from constants import *
+from camera import Camera
+from level_utils import generate_platforms
+from renderer import SpriteLayer
+from spatial import SpatialGrid
+from sprites import Platform
+
+
+def sprite_loop(surface, sprites, camera):
+    # What draw_world did for all_sprites every frame
+    for sprite in sprites:
+        if camera.is_visible(sprite.rect):
+            surface.blit(sprite.image, camera.apply(sprite.rect))
+
+
+def build_level(count):
+    branch = pygame.Surface((200, 20))
+    data, _ = generate_platforms(count, SCREEN_WIDTH, SCREEN_HEIGHT)
+    platforms = [Platform(p, branch) for p in data]
+    grid = SpatialGrid()
+    for p in platforms:
+        grid.insert(p)
+    return platforms, grid
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    surface = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    camera = Camera()
+    print(f"{'platforms':>10} {'loop us':>9} {'layer us':>9} {'drawn/frame':>12}")
+    for count in args.counts:
+        platforms, grid = build_level(count)
+        layer = SpriteLayer("platforms", grid.query_rect)
+        # Scroll up through the level so the visible set changes
+        top = -min(p.rect.top for p in platforms)
+        offsets = [top * frame / args.frames for frame in range(args.frames)]
+
+        start = time.perf_counter()
+        for offset in offsets:
+            camera.offset = offset
+            sprite_loop(surface, platforms, camera)
+        loop_us = (time.perf_counter() - start) * 1e6 / args.frames
+
+        drawn = 0
+        start = time.perf_counter()
+        for offset in offsets:
+            camera.offset = offset
+            layer.draw(surface, camera)
+            drawn += layer.count
+        layer_us = (time.perf_counter() - start) * 1e6 / args.frames
+
+        print(f"{count:>10} {loop_us:>9.1f} {layer_us:>9.1f} {drawn / args.frames:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
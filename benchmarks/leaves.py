@@ -0,0 +1,72 @@
+"""
+Falling-leaf benchmark: sprites.Leaf group vs leaf_field.LeafField.
+
+    python benchmarks/leaves.py --counts 50 1000 10000
+"""
+import random
+import time
+
+import common  # Headless SDL and repo root on sys.path; keep first
+import pygame
+from constants import *
+from sprites import Leaf
+from leaf_field import LeafField
+from level_utils import get_breeze_strength
+
+
+def run(leaves, screen, frames):
+    """Time `frames` update+draw passes. Returns (update ms, draw ms) per frame."""
+    update_time = draw_time = 0.0
+    t = 0.0
+    for _ in range(frames):
+        t += FIXED_DT
+        breeze = get_breeze_strength(t)
+        start = time.perf_counter()
+        leaves.update(breeze, FIXED_DT)
+        mid = time.perf_counter()
+        leaves.draw(screen)
+        end = time.perf_counter()
+        update_time += mid - start
+        draw_time += end - mid
+    return update_time * 1000 / frames, draw_time * 1000 / frames
+
+
+# Both implementations start leaves above the screen; the benchmark spreads
+# them over the visible area so every leaf is drawn from the first frame.
+
+def sprite_leaves(count):
+    group = pygame.sprite.Group()
+    for _ in range(count):
+        leaf = Leaf(random.randint(0, SCREEN_WIDTH), random.randint(0, SCREEN_HEIGHT))
+        leaf.y = leaf.rect.centery
+        group.add(leaf)
+    return group
+
+
+def leaf_field(count):
+    field = LeafField(count)
+    field.y[:] = field.rng.uniform(0, SCREEN_HEIGHT, count)
+    return field
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[50, 1000, 10000])
+    parser.add_argument("--frames", type=int, default=120)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    print(f"{'leaves':>8} {'impl':>10} {'update ms':>10} {'draw ms':>9} {'fps':>8}")
+    for count in args.counts:
+        for name, leaves in (("Leaf", sprite_leaves(count)), ("LeafField", leaf_field(count))):
+            update_ms, draw_ms = run(leaves, screen, args.frames)
+            fps = 1000 / (update_ms + draw_ms)
+            print(f"{count:>8} {name:>10} {update_ms:>10.3f} {draw_ms:>9.3f} {fps:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
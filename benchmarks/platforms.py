@@ -0,0 +1,75 @@
+"""
+Platform motion benchmark: the old per-sprite update loop vs the vectorized
+platform_motion.PlatformMotion step, including spatial index maintenance.
+
+    python benchmarks/platforms.py --counts 10 100 1000 10000
+"""
+import math
+import time
+
+import common  # Headless SDL and repo root on sys.path; keep first
+import pygame
+from constants import *
+from level_utils import generate_platforms
+from platform_motion import PlatformMotion
+from spatial import SpatialGrid
+from sprites import Platform
+
+BREEZE = 4
+
+
+def sprite_update(platform, breeze_strength, time_elapsed, dt):
+    # What Platform.update did for each platform every frame
+    platform.prev_rect = platform.rect.copy()
+    platform.rect.x = platform.original_x + breeze_strength * math.sin(time_elapsed + platform.offset_phase)
+    if not getattr(platform, "is_ground", False):
+        platform.phase += 0.05 * dt * FPS
+        platform.rect.y = platform.base_y + breeze_strength * math.sin(platform.phase)
+
+
+def build_level(count):
+    branch = pygame.Surface((200, 20))
+    data, _ = generate_platforms(count, SCREEN_WIDTH, SCREEN_HEIGHT)
+    platforms = [Platform(p, branch) for p in data]
+    grid = SpatialGrid()
+    for p in platforms:
+        grid.insert(p)
+    return platforms, grid
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    print(f"{'platforms':>10} {'sprites us':>11} {'arrays us':>10} {'moved/frame':>12}")
+    for count in args.counts:
+        platforms, grid = build_level(count)
+        start = time.perf_counter()
+        for frame in range(args.frames):
+            t = frame * FIXED_DT
+            for p in platforms:
+                sprite_update(p, BREEZE, t, FIXED_DT)
+                grid.update(p)
+        sprites_us = (time.perf_counter() - start) * 1e6 / args.frames
+
+        platforms, grid = build_level(count)
+        motion = PlatformMotion()
+        for p in platforms:
+            motion.add(p)
+        moved = 0
+        start = time.perf_counter()
+        for frame in range(args.frames):
+            for p in motion.step(BREEZE, frame * FIXED_DT, FIXED_DT):
+                grid.update(p)
+                moved += 1
+        arrays_us = (time.perf_counter() - start) * 1e6 / args.frames
+
+        print(f"{count:>10} {sprites_us:>11.1f} {arrays_us:>10.1f} {moved / args.frames:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
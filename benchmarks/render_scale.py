@@ -0,0 +1,57 @@
+"""
+Render scale benchmark: frame draw time (scene, HUD and the stretch to the
+window) at several internal render resolutions, against native.
+
+    python benchmarks/render_scale.py --scales 1 0.75 0.5 --frames 300
+"""
+import time
+
+import common  # Headless SDL and repo root on sys.path; keep first
+import numpy as np
+from render_scale import scale_arg
+from run import load_game
+from scenes import Scene
+
+
+def time_render(game, scene, frames, warmup=30):
+    for _ in range(warmup):  # Fill the scaled image cache
+        scene.step()
+        game.world = scene.world
+        game.draw_frame()
+    draw = np.empty(frames)
+    for i in range(frames):
+        scene.step()
+        game.world = scene.world
+        start = time.perf_counter()
+        game.draw_frame()
+        draw[i] = time.perf_counter() - start
+    return draw * 1000
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("scenes", nargs="*", default=["level10", "dogs_max", "leaves_5000"])
+    parser.add_argument("--scales", type=scale_arg, nargs="+", default=[1.0, 0.75, 0.5])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--scaled-hud", action="store_true", help="draw the HUD at the render scale too")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    game = load_game()
+    print(f"{'scene':<12}{'scale':>6}{'render ms':>11}{'p95 ms':>9}{'vs 1.0':>8}")
+    for name in args.scenes:
+        native = None
+        for scale in args.scales:
+            game.set_render_scale(scale, hud_native=not args.scaled_hud)
+            draw = time_render(game, Scene(name, args.seed), args.frames)
+            mean = draw.mean()
+            native = native or (mean if scale >= 1 else None)
+            saving = f"{mean / native - 1:+.0%}" if native else "-"
+            print(f"{name:<12}{scale:>6.2f}{mean:>11.3f}{np.percentile(draw, 95):>9.3f}{saving:>8}")
+    game.set_render_scale(1.0)
+
+
+if __name__ == "__main__":
+    main()
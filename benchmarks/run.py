@@ -0,0 +1,159 @@
+"""
+Benchmark suite: canned scenes (see scenes.py) timed under the SDL dummy
+video driver, with update and render measured separately.
+
+    python benchmarks/run.py                          # all scenes, table
+    python benchmarks/run.py --json results.json      # also write JSON
+    python benchmarks/run.py --baseline results.json  # compare, exit 1 on regressions
+"""
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from common import SurfaceAllocCounter  # Also sets up headless SDL; keep first
+import numpy as np
+import pygame
+from scenes import SCENES, Scene
+
+# Lower is better for all of these; FPS is derived from them
+COMPARED = ("update_ms", "render_ms", "surfaces_per_frame")
+
+
+def load_game():
+    """Import kitty.py for its drawing code (opens the dummy display)."""
+    import kitty
+    kitty.loader.run()  # Load everything up front, no splash
+    kitty.use_level_assets()
+    return kitty
+
+
+def render(game, world):
+    game.world = world
+    game.draw_frame()
+
+
+def time_scene(scene, game, frames):
+    """Mean update and render ms per frame, measured in separate loops."""
+    update = np.empty(frames)
+    for i in range(frames):
+        start = time.perf_counter()
+        scene.step()
+        update[i] = time.perf_counter() - start
+
+    draw = np.empty(frames)
+    for i in range(frames):
+        start = time.perf_counter()
+        render(game, scene.world)
+        draw[i] = time.perf_counter() - start
+    return update * 1000, draw * 1000
+
+
+def count_allocations(scene, game, frames):
+    """Surfaces created and peak transient Python bytes per full frame."""
+    transient = 0
+    tracemalloc.start()
+    with SurfaceAllocCounter() as counter:
+        for _ in range(frames):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            scene.step()
+            render(game, scene.world)
+            transient += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    return counter.count / frames, transient / frames
+
+
+def run_scene(name, game, frames, warmup, seed):
+    scene = Scene(name, seed)
+    for _ in range(warmup):  # Fill the frame caches and pools
+        scene.step()
+        render(game, scene.world)
+    update, draw = time_scene(scene, game, frames)
+    surfaces, transient = count_allocations(scene, game, max(1, frames // 4))
+    total = update + draw
+    return {
+        "update_ms": float(update.mean()),
+        "update_p95_ms": float(np.percentile(update, 95)),
+        "render_ms": float(draw.mean()),
+        "render_p95_ms": float(np.percentile(draw, 95)),
+        "fps": float(1000 / total.mean()),
+        "surfaces_per_frame": float(surfaces),
+        "alloc_kb_per_frame": float(transient / 1024),
+    }
+
+
+def compare(results, baseline, threshold):
+    """Print the change per metric against `baseline`; return the regressions."""
+    regressions = []
+    print(f"\n{'scene':<13}{'metric':<20}{'baseline':>10}{'now':>10}{'change':>9}")
+    for name, stats in results.items():
+        old = baseline.get("scenes", {}).get(name)
+        if old is None:
+            continue
+        for metric in COMPARED:
+            before, now = old.get(metric), stats[metric]
+            if before is None:
+                continue
+            change = (now - before) / before if before else (0.0 if now == before else float("inf"))
+            flag = ""
+            if change > threshold:
+                regressions.append((name, metric, change))
+                flag = "  REGRESSION"
+            print(f"{name:<13}{metric:<20}{before:>10.3f}{now:>10.3f}{change:>+8.0%}{flag}")
+    return regressions
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("scenes", nargs="*", default=list(SCENES), help="scenes to run (default: all)")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against an earlier --json file")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative slowdown counted as a regression (default 0.10)")
+    args = parser.parse_args()
+
+    unknown = set(args.scenes) - set(SCENES)
+    if unknown:
+        parser.error(f"unknown scenes: {', '.join(sorted(unknown))} (have {', '.join(SCENES)})")
+
+    game = load_game()
+    results = {}
+    print(f"{'scene':<13}{'update ms':>10}{'render ms':>10}{'fps':>8}{'surf/f':>8}{'KB/f':>8}")
+    for name in args.scenes:
+        stats = results[name] = run_scene(name, game, args.frames, args.warmup, args.seed)
+        print(f"{name:<13}{stats['update_ms']:>10.3f}{stats['render_ms']:>10.3f}{stats['fps']:>8.0f}"
+              f"{stats['surfaces_per_frame']:>8.2f}{stats['alloc_kb_per_frame']:>8.1f}")
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "frames": args.frames,
+            "seed": args.seed,
+        },
+        "scenes": results,
+    }
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=1)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Canned gameplay scenes built from the real World and sprite classes, for
+the benchmark suite (see run.py).
+"""
+import common  # Headless SDL and repo root on sys.path; keep first
+from constants import *
+from world import World
+
+# name -> World settings plus what the scene keeps on screen
+SCENES = {
+    "level1": dict(level=1, difficulty=1),
+    "level10": dict(level=10, difficulty=3),
+    "dogs_max": dict(level=5, difficulty=3, dogs=3),  # max concurrent dogs at difficulty 3
+    "eagle": dict(level=5, difficulty=2, eagle=True),
+    "leaves_50": dict(level=1, difficulty=1, leaves=50),
+    "leaves_5000": dict(level=1, difficulty=1, leaves=5000),
+}
+
+
+class Scene:
+    """A World plus the bits that keep it in its benchmark state."""
+
+    def __init__(self, name, seed=1):
+        self.name = name
+        self.settings = SCENES[name]
+        self.world = World(level=self.settings["level"], difficulty=self.settings["difficulty"],
+                           max_leaves=self.settings.get("leaves", MAX_LEAVES), seed=seed)
+        # Spread leaves over the visible area instead of waiting above it
+        leaves = self.world.leaves
+        leaves.y[:] = leaves.rng.uniform(0, SCREEN_HEIGHT, len(leaves))
+        self.maintain()
+
+    def maintain(self):
+        """Re-establish the scene's dogs / eagle (after a restart or flyby)."""
+        world = self.world
+        world.lives = 3  # Never game over, so the scene can't stall on that screen
+        dogs = self.settings.get("dogs", 0)
+        if len(world.dogs) < dogs:
+            # Dogs normally spawn above the view; put them on visible
+            # platforms so the render pass draws them
+            occupied = {dog.platform for dog in world.dogs}
+            platforms = sorted((p for p in world.platforms if not p.is_ground and p not in occupied),
+                               key=lambda p: -p.rect.y)
+            for platform in platforms[:dogs - len(world.dogs)]:
+                world.add_dog(platform)
+        if self.settings.get("eagle") and not world.eagles:
+            world.spawn_eagle_logic()
+
+    def step(self):
+        self.world.step()
+        self.maintain()
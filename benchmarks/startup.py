@@ -0,0 +1,65 @@
+"""
+Startup benchmark: time to the first frame, to the first level's assets
+being loaded and to the first level running, with assets loaded on the
+worker thread behind the splash vs all up front before the first frame.
+
+Each run is a fresh interpreter, so imports and SDL startup are counted.
+
+    python benchmarks/startup.py --runs 5
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+import common  # Headless SDL and repo root on sys.path; keep first
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+# Run in the child: import the game, queue a key press so the splash
+# leaves as soon as it may, then stop once the first level frame is shown.
+CHILD = """
+import kitty
+import json, sys
+import pygame
+
+def stop():
+    sys.stderr.write(json.dumps(kitty.startup_times) + "\\n")
+    sys.exit()
+
+kitty.report_startup = stop
+if {eager}:
+    kitty.loader.run()
+else:
+    kitty.loader.start()
+pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+kitty.splash_screen()
+kitty.main_game(seed=1)
+"""
+
+PHASES = ("first_frame", "assets_ready", "playable")
+
+
+def run_once(eager):
+    result = subprocess.run([sys.executable, "-c", CHILD.format(eager=eager)], cwd=ROOT,
+                            env=os.environ, capture_output=True, text=True, check=True)
+    return json.loads(result.stderr.strip().splitlines()[-1])
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'loading':<12}" + "".join(f"{phase.replace('_', ' ') + ' ms':>17}" for phase in PHASES))
+    for label, eager in (("up front", True), ("background", False)):
+        runs = [run_once(eager) for _ in range(args.runs)]
+        medians = [statistics.median(run[phase] for run in runs) * 1000 for phase in PHASES]
+        print(f"{label:<12}" + "".join(f"{ms:>17.1f}" for ms in medians))
+
+
+if __name__ == "__main__":
+    main()
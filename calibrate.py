@@ -0,0 +1,294 @@
+"""
+Monte Carlo difficulty calibration: play thousands of seeded levels per
+(level, difficulty) cell headless with a heuristic agent, across all
+cores, and report how often the agent completes them, how long it takes
+and what kills it.
+
+    python calibrate.py --runs 1000
+    python calibrate.py --levels 4 5 6 --difficulties 3 --dog-base 3=4000 --json dogs.json
+
+The tuning constants (see constants.py) can be overridden for a run to see
+how a change would play out before committing to it.
+"""
+import json
+import multiprocessing as mp
+import os
+import time
+
+import numpy as np
+import pygame
+
+import constants
+import level_pack
+import level_utils
+import world as world_module
+from constants import *
+from level_utils import get_breeze_strength
+from reachability import default_envelope
+from world import World, Inputs, seed_arg
+
+OUTCOMES = ("complete", "fell", "hit_dog", "hit_eagle", "timeout")
+# Modules holding a copy of the tuning constants (from constants import *)
+TUNED_MODULES = (constants, level_utils, world_module, level_pack)
+
+
+class ClimbAgent:
+    """
+    Scripted player: from each platform, pick the lowest platform above it
+    that Kitty's jump envelope says she can reach (the final one if it is
+    in reach), and walk toward it until a full-height jump, steering for
+    its middle, is predicted to land on it. The prediction replays Kitty's
+    movement rules with the coming breeze, so she waits out a headwind at
+    the platform edge the way a player would. She also waits while a dog
+    is where she would land or an eagle crosses her jump, but doesn't dodge
+    eagles while standing, so eagle rates are on the high side.
+
+    It sees what a player sees (the platforms, enemies and breeze), not
+    the rng, so its failure rates track the level rather than its luck.
+    """
+
+    def __init__(self, envelope=None, dog_clearance=120, overlap=15):
+        self.envelope = envelope or default_envelope()
+        self.dog_clearance = dog_clearance
+        self.overlap = overlap  # Columns to land on, against platform sway
+        self.target = None
+
+    def reset(self):
+        self.target = None
+
+    def _choose_target(self, world, src):
+        s = tuple(src.rect)
+        above = [p for p in world.platforms if p.rect.top < src.rect.top]
+        reachable = [p for p in above if self.envelope.can_reach(s, tuple(p.rect))]
+        final = [p for p in reachable if p.is_final]
+        if final:
+            return final[0]
+        if reachable:
+            return max(reachable, key=lambda p: p.rect.top)  # Next rung up
+        return max(above, key=lambda p: p.rect.top) if above else None
+
+    def _landing(self, world, target):
+        """Kitty's x where a jump starting now lands on `target`, or None."""
+        kitty = world.kitty
+        t = target.rect
+        x = kitty.rect.x
+        width = kitty.rect.width
+        bottom = kitty.rect.bottom
+        velocity = 0
+        height = kitty.rect.height
+        ascend_frames = int(kitty.max_jump_duration * FPS)
+        elapsed = world.time_elapsed
+        # Eagles fly straight; shrunk a little as their art doesn't fill the rect
+        eagles = [(e.rect.inflate(-20, -20), e.velocity_x * FIXED_DT, e.velocity_y * FIXED_DT)
+                  for e in world.eagles]
+        for frame in range(1, 4 * FPS):
+            aim = x + width // 2 - t.centerx
+            if aim > 5:
+                x -= kitty.speed
+            elif aim < -5:
+                x += kitty.speed
+            if frame <= ascend_frames:
+                x += round(get_breeze_strength(elapsed + frame * FIXED_DT) * 0.3)
+            x = min(max(x, 0), SCREEN_WIDTH - width)
+            if frame <= ascend_frames:
+                velocity += kitty.upward_acceleration
+            elif frame == ascend_frames + 1:
+                velocity = kitty.gravity
+            else:
+                velocity += kitty.gravity
+            previous = bottom
+            bottom += velocity
+            for rect, vx, vy in eagles:
+                if rect.move(vx * frame, vy * frame).colliderect((x, bottom - height, width, height)):
+                    return None
+            if velocity > 0 and previous <= t.top <= bottom:
+                overlap = min(x + width, t.right) - max(x, t.left)
+                return x + width // 2 if overlap >= self.overlap else None
+            if velocity > 0 and bottom > t.top:
+                return None  # Never got above it
+        return None
+
+    def _dog_in_the_way(self, world, target, x):
+        return any(dog.platform is target and abs(dog.rect.centerx - x) < self.dog_clearance
+                   for dog in world.dogs)
+
+    def _standing_on(self, world):
+        # Undulating platforms drop away from under Kitty or rise a few
+        # pixels into her, so a platform near her feet counts even while
+        # she is briefly "falling"
+        kitty = world.kitty
+        rect = kitty.rect
+        if kitty.jump or kitty.velocity > 2:
+            return None
+        feet = pygame.Rect(rect.left, rect.bottom - 20, rect.width, 24)
+        for platform in world.platform_index.query_rect(feet):
+            if platform.rect.top >= rect.bottom - 20:
+                return platform
+        return None
+
+    def act(self, world):
+        kitty = world.kitty
+        rect = kitty.rect
+        src = self._standing_on(world)
+        if src is None:
+            # Airborne: steer for the middle of the target
+            target = self.target
+            if target is None:
+                return Inputs(False, False, False, False)
+            tx = target.rect.centerx
+            return Inputs(rect.centerx > tx + 5, rect.centerx < tx - 5, False, False)
+
+        target = self.target = self._choose_target(world, src)
+        if target is None:
+            return Inputs(False, False, False, False)
+
+        landing = self._landing(world, target)
+        if landing is not None:
+            if self._dog_in_the_way(world, target, landing):
+                return Inputs(False, False, False, False)
+            return Inputs(False, False, True, False)
+
+        # Walk toward the target, but not off the platform (Kitty stands
+        # while any of her columns is over it); at the edge, wait
+        left = rect.centerx > target.rect.centerx and rect.right - kitty.speed > src.rect.left + 10
+        right = rect.centerx < target.rect.centerx and rect.left + kitty.speed < src.rect.right - 10
+        return Inputs(left, right, False, False)
+
+
+def play_level(level, difficulty, seed, agent, max_time=60.0):
+    """Play one level with one life. Returns (outcome, seconds)."""
+    world = World(level=level, difficulty=difficulty, lives=1, max_leaves=0, seed=seed)
+    agent.reset()
+    for _ in range(int(max_time * FPS)):
+        events = world.step(agent.act(world))
+        if events:
+            outcome = "complete" if "level_complete" in events else events[0]
+            return outcome, world.now / 1000
+    return "timeout", world.now / 1000
+
+
+def apply_tuning(tuning):
+    """Override tuning constants (name -> value) wherever they were imported."""
+    for name, value in tuning.items():
+        for module in TUNED_MODULES:
+            if hasattr(module, name):
+                setattr(module, name, value)
+
+
+def _play_batch(args):
+    level, difficulty, seeds, max_time, tuning = args
+    apply_tuning(tuning)
+    agent = ClimbAgent()
+    counts = dict.fromkeys(OUTCOMES, 0)
+    times = []
+    for seed in seeds:
+        outcome, seconds = play_level(level, difficulty, seed, agent, max_time)
+        counts[outcome] += 1
+        if outcome == "complete":
+            times.append(seconds)
+    return level, difficulty, counts, times
+
+
+def calibrate(levels, difficulties, runs, seed=0, workers=None, batch=50, max_time=60.0, tuning=None):
+    """
+    Play `runs` seeds per (level, difficulty) cell across a process pool.
+    Returns {(level, difficulty): {"runs", outcome counts..., "times"}}.
+    Level seeds are `seed` onwards, the same in every cell.
+    """
+    tuning = tuning or {}
+    jobs = []
+    for level in levels:
+        for difficulty in difficulties:
+            for start in range(seed, seed + runs, batch):
+                jobs.append((level, difficulty, range(start, min(start + batch, seed + runs)), max_time, tuning))
+
+    results = {(l, d): dict(dict.fromkeys(OUTCOMES, 0), runs=0, times=[]) for l in levels for d in difficulties}
+    with mp.Pool(workers or os.cpu_count()) as pool:
+        for level, difficulty, counts, times in pool.imap_unordered(_play_batch, jobs):
+            cell = results[level, difficulty]
+            for outcome, count in counts.items():
+                cell[outcome] += count
+                cell["runs"] += count
+            cell["times"].extend(times)
+    return results
+
+
+def summarize(results):
+    """Rows of per-cell rates and completion time percentiles."""
+    rows = []
+    for (level, difficulty), cell in sorted(results.items()):
+        runs = cell["runs"]
+        times = np.array(cell["times"])
+        row = {"level": level, "difficulty": difficulty, "runs": runs}
+        for outcome in OUTCOMES:
+            row[outcome] = cell[outcome] / runs if runs else 0.0
+        for p in (50, 90):
+            row[f"time_p{p}"] = float(np.percentile(times, p)) if len(times) else None
+        rows.append(row)
+    return rows
+
+
+def print_table(rows):
+    print(f"{'level':>5} {'diff':>4} {'runs':>6} {'complete':>9} {'p50 s':>6} {'p90 s':>6}"
+          f" {'fell':>6} {'dog':>6} {'eagle':>6} {'timeout':>8}")
+    for row in rows:
+        p50 = f"{row['time_p50']:.1f}" if row["time_p50"] is not None else "-"
+        p90 = f"{row['time_p90']:.1f}" if row["time_p90"] is not None else "-"
+        print(f"{row['level']:>5} {row['difficulty']:>4} {row['runs']:>6} {row['complete']:>9.1%} {p50:>6} {p90:>6}"
+              f" {row['fell']:>6.1%} {row['hit_dog']:>6.1%} {row['hit_eagle']:>6.1%} {row['timeout']:>8.1%}")
+
+
+def parse_dog_base(values):
+    base = dict(DOG_SPAWN_BASE)
+    for value in values:
+        difficulty, ms = value.split("=")
+        base[int(difficulty)] = int(ms)
+    return base
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Measure level completion odds with a heuristic agent.")
+    parser.add_argument("--levels", type=int, nargs="+", default=list(range(1, 11)))
+    parser.add_argument("--difficulties", type=int, nargs="+", default=[1, 2, 3])
+    parser.add_argument("--runs", type=int, default=1000, help="seeded levels per level/difficulty cell")
+    parser.add_argument("--seed", type=seed_arg, default=0, help="first level seed")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: one per CPU)")
+    parser.add_argument("--max-time", type=float, default=60.0, help="simulated seconds before a level times out")
+    parser.add_argument("--json", metavar="PATH", help="also write the table and settings as JSON")
+    tuning_group = parser.add_argument_group("tuning overrides (constants.py)")
+    tuning_group.add_argument("--dog-base", nargs="+", metavar="DIFFICULTY=MS", default=[],
+                              help="DOG_SPAWN_BASE entries")
+    tuning_group.add_argument("--eagle-interval", type=int, nargs=2, metavar=("MIN_MS", "MAX_MS"))
+    tuning_group.add_argument("--width-shrink", type=int, help="PLATFORM_WIDTH_SHRINK")
+    tuning_group.add_argument("--gap-growth", type=int, help="PLATFORM_GAP_GROWTH")
+    args = parser.parse_args()
+
+    tuning = {}
+    if args.dog_base:
+        tuning["DOG_SPAWN_BASE"] = parse_dog_base(args.dog_base)
+    if args.eagle_interval:
+        tuning["EAGLE_SPAWN_INTERVAL"] = tuple(args.eagle_interval)
+    if args.width_shrink is not None:
+        tuning["PLATFORM_WIDTH_SHRINK"] = args.width_shrink
+    if args.gap_growth is not None:
+        tuning["PLATFORM_GAP_GROWTH"] = args.gap_growth
+
+    start = time.perf_counter()
+    results = calibrate(args.levels, args.difficulties, args.runs, args.seed, args.workers,
+                        max_time=args.max_time, tuning=tuning)
+    elapsed = time.perf_counter() - start
+    rows = summarize(results)
+    print_table(rows)
+    total = sum(row["runs"] for row in rows)
+    print(f"{total} levels in {elapsed:.1f}s ({total / elapsed:.0f} levels/s)")
+
+    if args.json:
+        settings = {name: getattr(constants, name) for name in
+                    ("DOG_SPAWN_BASE", "EAGLE_SPAWN_INTERVAL", "PLATFORM_WIDTH_SHRINK", "PLATFORM_GAP_GROWTH")}
+        settings.update(tuning)
+        settings["DOG_SPAWN_BASE"] = {str(k): v for k, v in settings["DOG_SPAWN_BASE"].items()}
+        with open(args.json, "w") as f:
+            json.dump({"settings": settings, "runs": args.runs, "seed": args.seed,
+                       "max_time": args.max_time, "cells": rows}, f, indent=2)
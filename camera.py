@@ -0,0 +1,54 @@
+import pygame
+from constants import *
+
+
+class Camera:
+    """
+    Vertical camera over world coordinates.
+
+    Everything in the world keeps its own (world) position; the camera only
+    stores how far the view has scrolled up. `offset` grows as Kitty climbs,
+    and screen y = world y + offset. Nothing is moved when the camera moves.
+    """
+
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        self.width = width
+        self.height = height
+        self.offset = 0.0
+        self.following = False
+
+    def reset(self):
+        self.offset = 0.0
+        self.following = False
+
+    def follow(self, kitty):
+        """Scroll up towards Kitty while she jumps above the middle of the screen."""
+        screen_top = kitty.rect.top + self.offset
+        if kitty.jump and screen_top <= self.height / 2:
+            self.following = True
+
+        if self.following and not kitty.falling:
+            self.offset += max(0, (self.height / 2) - screen_top) * 0.1
+
+        if kitty.falling:
+            self.following = False
+
+    # ------------------ World <-> screen -------------------
+
+    def screen_y(self, world_y):
+        return world_y + int(self.offset)
+
+    def world_y(self, screen_y):
+        return screen_y - int(self.offset)
+
+    def apply(self, rect):
+        """Screen-space copy of a world rect, for blitting."""
+        return rect.move(0, int(self.offset))
+
+    def view_rect(self):
+        """The visible area in world coordinates."""
+        return pygame.Rect(0, -int(self.offset), self.width, self.height)
+
+    def is_visible(self, rect, margin=0):
+        top = -int(self.offset) - margin
+        return rect.bottom > top and rect.top < top + self.height + 2 * margin
@@ -4,6 +4,8 @@ import pygame
 # ------------------ Constants -------------------
 SCREEN_WIDTH, SCREEN_HEIGHT = 600, 1200
 FPS = 60
+FIXED_DT = 1.0 / FPS  # Simulation step (seconds), independent of render rate
+MAX_FRAME_TIME = 0.25  # Clamp for long frames so the simulation can catch up
 
 # Colors
 BLACK = (0, 0, 0)
@@ -23,3 +25,19 @@ FALL_COLORS = [
 ]
 
 MAX_LEAVES = 50
+LEAF_ANGLE_STEP = 5  # Degrees between pre-rotated leaf frames
+LEAF_FRAME_CACHE_SIZE = 8192  # Max cached leaf frames (sizes x colors x angles)
+PLATFORM_TEXTURE_CACHE_SIZE = 512  # Max cached platform sizes
+
+# Full-width strip at the bottom of every level, as (x, y, width, height)
+GROUND_PLATFORM = (0, SCREEN_HEIGHT - 10, SCREEN_WIDTH, 10)
+
+# Difficulty tuning; calibrate.py measures how these play out
+# Dog spawn interval base (ms) per difficulty
+DOG_SPAWN_BASE = {1: 8000, 2: 5000, 3: 3000}
+# Eagle spawn interval range (ms)
+EAGLE_SPAWN_INTERVAL = (5000, 10000)
+# Per difficulty x level, how much platforms shrink and gaps grow (px) by
+# the top of a level
+PLATFORM_WIDTH_SHRINK = 5
+PLATFORM_GAP_GROWTH = 10
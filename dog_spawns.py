@@ -0,0 +1,141 @@
+class DogSpawnIndex:
+    """
+    The platforms dogs may spawn on, keyed by their `spawn_index`, kept up
+    to date as dogs come and go so picking a spawn platform is O(1).
+
+    Spawn indices are consecutive and run in height order: from the top
+    down for a built level (`top_first`, as level_utils assigns them), from
+    the bottom up for the endless tower, where platforms are added at the
+    top and retired from the bottom.
+
+    Two things are tracked incrementally:
+    - which candidates are above the view: always a run of indices at the
+      top end, whose boundary moves with the camera;
+    - an occupancy bitset over spawn indices, with each dog's platform and
+      its two neighbours blocked so dogs don't spawn side by side.
+    A spawn then tries a few random picks from the off-screen run and only
+    scans it when nearly every slot is blocked.
+    """
+
+    def __init__(self, spawn_buffer=50, tries=4):
+        self.spawn_buffer = spawn_buffer
+        self.tries = tries
+        self.reset()
+
+    def reset(self, platforms=(), top_first=True):
+        """Index `platforms`, which carry consecutive spawn indices."""
+        self.top_first = top_first
+        self.slots = {p.spawn_index: p for p in platforms}
+        self.low = min(self.slots, default=0)
+        self.high = max(self.slots, default=-1) + 1  # Live indices are low..high-1
+        self.cut = self.low if top_first else self.high  # Off-screen boundary
+        self.occupied = {}  # spawn index -> dogs on that platform
+        self.blocked = 0    # Bit i set: index base + i is taken or next to a dog
+        self.base = self.low
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __iter__(self):
+        return (self.slots[i] for i in range(self.low, self.high) if i in self.slots)
+
+    def __contains__(self, platform):
+        return self.slots.get(platform.spawn_index) is platform
+
+    # ------------------ Candidates (endless tower) -------------------
+
+    def add(self, platform):
+        """Add the next platform at the top; it takes spawn index `high`."""
+        platform.spawn_index = self.high
+        self.slots[self.high] = platform
+        self.high += 1
+
+    def remove(self, platform):
+        if platform not in self:
+            return
+        index = platform.spawn_index
+        del self.slots[index]
+        self.occupied.pop(index, None)
+        while self.low < self.high and self.low not in self.slots:
+            self.low += 1
+        self.cut = min(max(self.cut, self.low), self.high)
+        self._rebuild_blocked()
+
+    # ------------------ Occupancy -------------------
+
+    def occupy(self, platform):
+        index = platform.spawn_index
+        if platform in self:
+            self.occupied[index] = self.occupied.get(index, 0) + 1
+            self._rebuild_blocked()
+
+    def _rebuild_blocked(self):
+        # At most a few dogs are alive, so rebuilding beats bookkeeping
+        # overlapping neighbour bits; rebasing keeps the bitset small in a
+        # long endless run.
+        self.base = base = self.low
+        blocked = 0
+        for index in self.occupied:
+            blocked |= 0b111 << (index - 1 - base) if index > base else 0b11 >> (base - index)
+        self.blocked = blocked
+
+    def is_free(self, index):
+        return not (self.blocked >> (index - self.base)) & 1
+
+    # ------------------ Selection -------------------
+
+    def _off_screen(self, view_top):
+        """Range of indices whose platforms are above the view."""
+        limit = view_top - self.spawn_buffer
+        slots = self.slots
+        cut = self.cut
+
+        def above(index):
+            platform = slots.get(index)
+            return platform is not None and platform.rect.bottom < limit
+
+        if self.top_first:
+            while cut < self.high and above(cut):
+                cut += 1
+            while cut > self.low and not above(cut - 1):
+                cut -= 1
+            self.cut = cut
+            return self.low, cut
+        while cut > self.low and above(cut - 1):
+            cut -= 1
+        while cut < self.high and not above(cut):
+            cut += 1
+        self.cut = cut
+        return cut, self.high
+
+    def allows(self, platform, view_top, avoid_rect=None):
+        """Whether a dog may spawn on `platform` now, by `choose`'s rules."""
+        return (platform in self and self.is_free(platform.spawn_index)
+                and platform.rect.bottom < view_top - self.spawn_buffer
+                and (avoid_rect is None or not platform.rect.colliderect(avoid_rect)))
+
+    def choose(self, view_top, rng, avoid_rect=None):
+        """
+        A free platform above `view_top` (world y), or None. `avoid_rect`
+        (Kitty) must not overlap it.
+        """
+        first, end = self._off_screen(view_top)
+        count = end - first
+        if count <= 0:
+            return None
+
+        def usable(index):
+            if not self.is_free(index):
+                return None
+            platform = self.slots.get(index)
+            if platform is None or (avoid_rect is not None and platform.rect.colliderect(avoid_rect)):
+                return None
+            return platform
+
+        for _ in range(self.tries):
+            platform = usable(first + rng.randrange(count))
+            if platform is not None:
+                return platform
+        # Mostly blocked: fall back to the free ones
+        free = [p for p in map(usable, range(first, end)) if p is not None]
+        return rng.choice(free) if free else None
@@ -0,0 +1,349 @@
+"""
+Reset/step environments around the headless World, for training and
+evaluating automated players against the real sprites.py physics.
+
+`KittyEnv` follows the Gym API (`reset() -> (obs, info)`,
+`step(action) -> (obs, reward, terminated, truncated, info)`) without
+depending on gym. Observations are flat float32 arrays, see `OBS_SIZE`.
+
+`VectorKittyEnv` runs N seeded games across worker processes. Workers write
+observations, rewards and done flags straight into shared memory, so a
+vectorized step only sends one short message to each worker:
+
+    python env.py --envs 16 --steps 2000
+"""
+import multiprocessing as mp
+import os
+import random
+from multiprocessing import shared_memory
+
+import numpy as np
+import pygame
+
+from constants import *
+from level_utils import get_breeze_strength
+from world import World, Inputs, seed_arg
+
+# Actions: horizontal movement x jump key held. Holding jump longer jumps
+# higher, as with the space bar; the env turns held/not held into the
+# press and release edges World.step expects.
+ACTIONS = [
+    # left, right, jump held
+    (False, False, False),
+    (True, False, False),
+    (False, True, False),
+    (False, False, True),
+    (True, False, True),
+    (False, True, True),
+]
+NUM_ACTIONS = len(ACTIONS)
+
+# Observation layout, all relative to Kitty and scaled to about -1..1:
+#   Kitty: x, screen y, vertical velocity, jumping, falling, breeze
+#   NEAREST_PLATFORMS x (present, left dx, right dx, top dy, is final)
+#   MAX_DOGS x (present, dx, dy, direction)
+#   MAX_EAGLES x (present, dx, dy, horizontal velocity)
+# Absent slots are all zero. Platforms and dogs are nearest first.
+NEAREST_PLATFORMS = 8
+MAX_DOGS = 3
+MAX_EAGLES = 1
+KITTY_SIZE = 6
+PLATFORM_SIZE = 5
+DOG_SIZE = 4
+EAGLE_SIZE = 4
+OBS_SIZE = KITTY_SIZE + NEAREST_PLATFORMS * PLATFORM_SIZE + MAX_DOGS * DOG_SIZE + MAX_EAGLES * EAGLE_SIZE
+
+# Rewards: climbing to a new best height on the level (per 100 px), beating
+# a level, losing a life
+CLIMB_REWARD = 1.0
+LEVEL_REWARD = 10.0
+LIFE_PENALTY = -5.0
+
+# Lost-life events World.step reports
+LIFE_EVENTS = ("fell", "hit_dog", "hit_eagle")
+
+
+class KittyEnv:
+    """
+    One game as an environment. Each `step` runs `frame_skip` fixed World
+    steps with the same action. An episode ends (`terminated`) on game over
+    or when the last level is beaten, and is cut off (`truncated`) after
+    `max_steps` env steps.
+
+    `obs_buffer` is an optional float32 array of OBS_SIZE that observations
+    are written into, e.g. a slot of a shared-memory block; otherwise the
+    env owns one. Either way the returned observation is that buffer, so
+    copy it to keep it across steps.
+    """
+
+    def __init__(self, level=1, difficulty=1, lives=3, max_levels=10, endless=False, seed=None,
+                 frame_skip=1, max_steps=10000, max_leaves=0, obs_buffer=None):
+        self.settings = dict(level=level, difficulty=difficulty, lives=lives, max_levels=max_levels,
+                             endless=endless, max_leaves=max_leaves)
+        self.frame_skip = frame_skip
+        self.max_steps = max_steps
+        self.obs = np.zeros(OBS_SIZE, np.float32) if obs_buffer is None else obs_buffer
+        # Seeds for episodes reset without one
+        self.seed_rng = random.Random(seed)
+        self.world = None
+        self.steps = 0
+        self.jump_held = False
+        self.best_height = 0
+
+    def reset(self, seed=None):
+        """Start a new game; returns (observation, info)."""
+        if seed is None:
+            seed = self.seed_rng.randrange(2 ** 32)
+        self.world = World(seed=seed, **self.settings)
+        self.steps = 0
+        self.jump_held = False
+        self.best_height = self.world.kitty.rect.bottom
+        return self.observe(), {"seed": seed}
+
+    def step(self, action):
+        """Returns (observation, reward, terminated, truncated, info)."""
+        left, right, jump = ACTIONS[action]
+        world = self.world
+        inputs = Inputs(left, right, jump and not self.jump_held, self.jump_held and not jump)
+        self.jump_held = jump
+        reward = 0.0
+        terminated = False
+        events = []
+        for _ in range(self.frame_skip):
+            step_events = world.step(inputs)
+            inputs = Inputs(left, right, False, False)  # Edges only on the first frame
+            if step_events:
+                events.extend(step_events)
+                if "level_complete" in step_events:
+                    reward += LEVEL_REWARD
+                if any(event in LIFE_EVENTS for event in step_events):
+                    reward += LIFE_PENALTY
+                # Kitty is back on the ground of a new or restarted level
+                self.best_height = world.kitty.rect.bottom
+                if "game_over" in step_events or "game_won" in step_events:
+                    terminated = True
+                    break
+            # World y grows downwards
+            bottom = world.kitty.rect.bottom
+            if bottom < self.best_height:
+                reward += CLIMB_REWARD * (self.best_height - bottom) / 100
+                self.best_height = bottom
+        self.steps += 1
+        truncated = not terminated and self.max_steps is not None and self.steps >= self.max_steps
+        info = {"events": events, "level": world.current_level, "lives": world.lives}
+        return self.observe(), reward, terminated, truncated, info
+
+    def observe(self):
+        """Write the current observation into `obs` and return it."""
+        world = self.world
+        kitty = world.kitty
+        cx = kitty.rect.centerx
+        bottom = kitty.rect.bottom
+        # Built as one list and copied in once; per-slot array writes cost
+        # more than the rest of the observation
+        values = [
+            cx / SCREEN_WIDTH, world.camera.screen_y(bottom) / SCREEN_HEIGHT, kitty.velocity / 20,
+            kitty.jump, kitty.falling, get_breeze_strength(world.time_elapsed) / 6.5,
+        ]
+
+        # Platforms within a screen height above or below, nearest first
+        window = pygame.Rect(0, bottom - SCREEN_HEIGHT, SCREEN_WIDTH, 2 * SCREEN_HEIGHT)
+        nearby = []
+        for platform in world.platform_index.query_rect(window):
+            rect = platform.rect
+            dx = max(rect.left - cx, 0, cx - rect.right)
+            dy = rect.top - bottom
+            nearby.append((dx * dx + dy * dy, rect.left - cx, rect.right - cx, dy, getattr(platform, "is_final", False)))
+        nearby.sort()
+        for _, left, right, dy, final in nearby[:NEAREST_PLATFORMS]:
+            values += (1, left / SCREEN_WIDTH, right / SCREEN_WIDTH, dy / SCREEN_HEIGHT, final)
+        values += [0] * (PLATFORM_SIZE * (NEAREST_PLATFORMS - min(len(nearby), NEAREST_PLATFORMS)))
+
+        dogs = sorted(((d.rect.centerx - cx) ** 2 + (d.rect.bottom - bottom) ** 2, d.rect.centerx - cx,
+                       d.rect.bottom - bottom, d.direction) for d in world.dogs)[:MAX_DOGS]
+        for _, dx, dy, direction in dogs:
+            values += (1, dx / SCREEN_WIDTH, dy / SCREEN_HEIGHT, direction)
+        values += [0] * (DOG_SIZE * (MAX_DOGS - len(dogs)))
+
+        eagles = list(world.eagles)[:MAX_EAGLES]
+        for eagle in eagles:
+            values += (1, (eagle.rect.centerx - cx) / SCREEN_WIDTH,
+                       (eagle.rect.centery - kitty.rect.centery) / SCREEN_HEIGHT, eagle.velocity_x / 250)
+        values += [0] * (EAGLE_SIZE * (MAX_EAGLES - len(eagles)))
+
+        self.obs[:] = values
+        return self.obs
+
+
+# ------------------ Vectorized -------------------
+
+class _SharedBuffers:
+    """
+    The arrays a VectorKittyEnv shares with its workers, laid out in one
+    shared-memory block: observations, actions, rewards, done flags and the
+    return and length of each env's last finished episode.
+    """
+
+    FIELDS = (
+        ("obs", np.float32, (OBS_SIZE,)),
+        ("actions", np.int8, ()),
+        ("rewards", np.float32, ()),
+        ("terminated", np.bool_, ()),
+        ("truncated", np.bool_, ()),
+        ("episode_return", np.float32, ()),
+        ("episode_length", np.int32, ()),
+    )
+
+    def __init__(self, num_envs, name=None):
+        sizes = [num_envs * int(np.prod(shape, dtype=int)) * np.dtype(dtype).itemsize
+                 for _, dtype, shape in self.FIELDS]
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=sum(sizes))
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        offset = 0
+        for (field, dtype, shape), size in zip(self.FIELDS, sizes):
+            array = np.ndarray((num_envs,) + shape, dtype, self.shm.buf, offset)
+            setattr(self, field, array)
+            offset += size
+
+    def close(self):
+        for field, _, _ in self.FIELDS:
+            setattr(self, field, None)  # Views must go before the block closes
+        self.shm.close()
+
+
+def _worker(conn, shm_name, num_envs, first, last, seed, env_kwargs):
+    buffers = _SharedBuffers(num_envs, shm_name)
+    envs = [KittyEnv(seed=seed + i, obs_buffer=buffers.obs[i], **env_kwargs) for i in range(first, last)]
+    returns = np.zeros(len(envs))
+    try:
+        while True:
+            command, arg = conn.recv()
+            if command == "step":
+                actions = buffers.actions
+                for j, env in enumerate(envs):
+                    i = first + j
+                    _, reward, terminated, truncated, _ = env.step(actions[i])
+                    returns[j] += reward
+                    buffers.rewards[i] = reward
+                    buffers.terminated[i] = terminated
+                    buffers.truncated[i] = truncated
+                    if terminated or truncated:
+                        buffers.episode_return[i] = returns[j]
+                        buffers.episode_length[i] = env.steps
+                        returns[j] = 0
+                        env.reset()
+            elif command == "reset":
+                for j, env in enumerate(envs):
+                    env.reset(None if arg is None else arg + first + j)
+                returns[:] = 0
+            elif command == "close":
+                break
+            conn.send(None)
+    finally:
+        envs = None
+        buffers.close()
+        conn.close()
+
+
+class VectorKittyEnv:
+    """
+    `num_envs` independent KittyEnvs split across `workers` processes
+    (default: one per CPU). Env i is seeded from `seed + i`.
+
+    `step(actions)` steps every env and returns (obs, rewards, terminated,
+    truncated, info), arrays with one row per env. Envs that finish are
+    reset straight away, so their row of `obs` is the new episode's first
+    observation; `info["episode_return"]` and `info["episode_length"]` hold
+    the finished episode's totals. The arrays view shared memory and are
+    overwritten by the next step.
+    """
+
+    def __init__(self, num_envs, seed=0, workers=None, **env_kwargs):
+        self.num_envs = num_envs
+        workers = min(num_envs, workers or os.cpu_count() or 1)
+        self.buffers = _SharedBuffers(num_envs)
+        bounds = [num_envs * w // workers for w in range(workers + 1)]
+        self.connections = []
+        self.processes = []
+        for first, last in zip(bounds, bounds[1:]):
+            parent, child = mp.Pipe()
+            process = mp.Process(target=_worker, daemon=True,
+                                 args=(child, self.buffers.shm.name, num_envs, first, last, seed, env_kwargs))
+            process.start()
+            child.close()
+            self.connections.append(parent)
+            self.processes.append(process)
+
+    def _broadcast(self, command, arg=None):
+        for conn in self.connections:
+            conn.send((command, arg))
+        for conn in self.connections:
+            conn.recv()
+
+    def reset(self, seed=None):
+        """Reset every env (env i from `seed + i` if given); returns (obs, info)."""
+        self._broadcast("reset", seed)
+        return self.buffers.obs, {}
+
+    def step(self, actions):
+        buffers = self.buffers
+        buffers.actions[:] = actions
+        self._broadcast("step")
+        done = buffers.terminated | buffers.truncated
+        info = {"episode_return": np.where(done, buffers.episode_return, np.nan),
+                "episode_length": np.where(done, buffers.episode_length, 0)}
+        return buffers.obs, buffers.rewards, buffers.terminated, buffers.truncated, info
+
+    def close(self):
+        if self.buffers is None:
+            return
+        for conn in self.connections:
+            conn.send(("close", None))
+        for process in self.processes:
+            process.join()
+        self.buffers.close()
+        self.buffers.shm.unlink()
+        self.buffers = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Random-policy throughput of the Kitty environments.")
+    parser.add_argument("--envs", type=int, default=os.cpu_count() or 1, help="games in the vectorized env")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--steps", type=int, default=2000, help="env steps (per game for the vectorized env)")
+    parser.add_argument("--level", type=int, default=5)
+    parser.add_argument("--difficulty", type=int, default=2)
+    parser.add_argument("--seed", type=seed_arg, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    env = KittyEnv(level=args.level, difficulty=args.difficulty)
+    env.reset(args.seed)
+    actions = rng.integers(NUM_ACTIONS, size=args.steps)
+    start = time.perf_counter()
+    for action in actions:
+        _, _, terminated, truncated, _ = env.step(action)
+        if terminated or truncated:
+            env.reset()
+    elapsed = time.perf_counter() - start
+    print(f"single env: {args.steps / elapsed:.0f} steps/s")
+
+    with VectorKittyEnv(args.envs, seed=args.seed, workers=args.workers,
+                        level=args.level, difficulty=args.difficulty) as venv:
+        venv.reset(args.seed)
+        start = time.perf_counter()
+        for _ in range(args.steps):
+            venv.step(rng.integers(NUM_ACTIONS, size=args.envs))
+        elapsed = time.perf_counter() - start
+        print(f"{args.envs} envs on {len(venv.processes)} workers: {args.envs * args.steps / elapsed:.0f} steps/s")
@@ -0,0 +1,107 @@
+from collections import OrderedDict
+
+import pygame
+from constants import *
+
+
+class SurfaceCache:
+    """
+    Least-recently-used cache of prebuilt surfaces: rendered text, and
+    whole static screens (splash, game over) that only need building once.
+    """
+
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+
+    def get(self, key, build):
+        """The surface for `key`, calling `build()` to make it on a miss."""
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = self.surfaces[key] = build()
+            if len(self.surfaces) > self.max_size:
+                self.surfaces.popitem(last=False)
+        else:
+            self.surfaces.move_to_end(key)
+        return surface
+
+    def text(self, font, text, color, antialias=True):
+        return self.get((font, text, tuple(color), antialias),
+                        lambda: font.render(text, antialias, color))
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+class TextWidget:
+    """
+    Text showing `value()` through `fmt`, re-rendered only when the value
+    changes. A value of None hides the widget.
+    """
+
+    def __init__(self, font, value, pos, fmt="{}", color=BLACK, anchor="topleft"):
+        self.font = font
+        self.value = value
+        self.pos = pos
+        self.fmt = fmt
+        self.color = color
+        self.anchor = anchor
+        self.shown = object()  # Never equal to a real value, forces the first render
+        self.surface = None
+        self.rect = None
+
+    def draw(self, surface, cache):
+        value = self.value()
+        if value is None:
+            return
+        if value != self.shown:
+            self.shown = value
+            self.surface = cache.text(self.font, self.fmt.format(value), self.color)
+            self.rect = self.surface.get_rect(**{self.anchor: self.pos})
+        surface.blit(self.surface, self.rect)
+
+
+class IconRowWidget:
+    """`value()` copies of an icon in a row, laid out right to left from `right`."""
+
+    def __init__(self, image, value, right, y, spacing=45):
+        self.image = image
+        self.value = value
+        self.right = right
+        self.y = y
+        self.spacing = spacing
+        self.shown = None
+        self.positions = []
+
+    def draw(self, surface, cache):
+        count = self.value()
+        if count != self.shown:
+            self.shown = count
+            self.positions = [(self.right - (i + 1) * self.spacing, self.y) for i in range(count)]
+        for pos in self.positions:
+            surface.blit(self.image, pos)
+
+
+class Hud:
+    """
+    Retained-mode HUD: a translucent strip built once plus widgets that keep
+    their rendered surfaces between frames, so drawing it is a handful of
+    blits. New readouts are one `add()` each, e.g. a score:
+
+        hud.add(TextWidget(font, lambda: world.score, (300, 10), "Score: {}"))
+    """
+
+    def __init__(self, size, background=(255, 255, 255, 180), cache=None):
+        self.background = pygame.Surface(size, pygame.SRCALPHA)
+        self.background.fill(background)
+        self.cache = cache if cache is not None else SurfaceCache()
+        self.widgets = []
+
+    def add(self, widget):
+        self.widgets.append(widget)
+        return widget
+
+    def draw(self, surface):
+        surface.blit(self.background, (0, 0))
+        for widget in self.widgets:
+            widget.draw(surface, self.cache)
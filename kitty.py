@@ -1,16 +1,25 @@
 
 #!/usr/bin/python3
+import time
+startup_begin = time.perf_counter()  # Startup times are measured from here
+
 import pygame
 import sys
-import random
-import math
 from pygame import mixer
 from pygame.locals import *
 
 # Import modules
 from constants import *
-from sprites import Kitty, Platform, Dog, Leaf, Eagle
-from level_utils import get_breeze_strength, generate_platforms, setup_dog_spawn_candidates
+from sprites import preload_images, prerender_platform_textures
+from assets import assets, AssetLoader
+from background import BackgroundRenderer
+from world import World, Inputs, seed_arg
+from replay import Recorder
+from level_pack import LevelPack
+from profiler import FrameProfiler, ProfilerOverlay
+from hud import SurfaceCache, Hud, TextWidget, IconRowWidget
+from render_scale import ScaledCanvas, scale_arg
+from renderer import Renderer, DrawLayer, SpriteLayer
 
 # ------------------ Initialization -------------------------
 pygame.init()
@@ -27,411 +36,326 @@ font_large = pygame.font.SysFont(None, 75)
 font_medium = pygame.font.SysFont(None, 55)
 font_small = pygame.font.SysFont(None, 35)
 
-congrats_text = font_large.render("Congratulations Kitty!", True, (184, 134, 11))
-game_over_text = font_large.render("Game Over!", True, (255, 0, 0))
-restart_text = font_small.render("Press R to Restart or Q to Quit", True, BLACK)
-
-# Load Images
-branch_image = pygame.image.load('assets/branch.png')
-# Pass branch image to Platform class if I hadn't already... 
-# In sprites.py, Platform takes `image`. I need to pass `branch_image` when creating platforms.
-
-background_image = pygame.image.load('assets/Background_lvl1.png')
-background_image = pygame.transform.scale(background_image, (SCREEN_WIDTH, 3 * SCREEN_HEIGHT))
-
-splash_image = pygame.image.load('assets/Kitty_splash.png')
-splash_image = pygame.transform.scale(splash_image, (SCREEN_WIDTH, SCREEN_HEIGHT //2))
-
-kitty_mini = pygame.image.load("assets/kitty.png")
-kitty_mini = pygame.transform.scale(kitty_mini, (40, 40))
-
-# Load Sounds
-hiss_sound = pygame.mixer.Sound('assets/hiss.wav')
-meow_1 = pygame.mixer.Sound('assets/meow.wav')
-meow_2 = pygame.mixer.Sound('assets/meow2.wav')
-meow_sounds = [meow_1, meow_2]
-
-mixer.music.load('assets/BGM.ogg')
-mixer.music.play(-1)  # Loop music
-
-# Game State Variables
-max_levels = 10
-current_level = 5
-current_difficulty = 2
-level_complete = False
-lives = 3
-time_elapsed = 0
-
-camera_offset = 0
-camera_follow_kitty = False
-
-# Sprite Groups
-all_sprites = pygame.sprite.Group()
-platforms = pygame.sprite.Group()
-leaves = pygame.sprite.Group()
-dogs = pygame.sprite.Group()
-eagles = pygame.sprite.Group()
-
-# Other State
-final_platform_data = None
-dog_candidate_platforms = []
-next_dog_spawn_time = 0
-next_eagle_spawn_time = 0
-
-kitty = None # Will be initialized in setup/start
-
-# ------------------ Helper Functions -------------------
-
-def create_ground():
-    ground = Platform((0, SCREEN_HEIGHT - 10, SCREEN_WIDTH, 10), branch_image)
-    ground.is_ground = True
-    # Overwrite image with simple rect if we want, or just stick with branch stretch
-    # Actually the original code just used Platform with branch_image scaled.
-    return ground
-
-def initialize_leaves():
-    leaves.empty()
-    for _ in range(MAX_LEAVES):
-        x = random.randint(0, SCREEN_WIDTH)
-        y = random.randint(-SCREEN_HEIGHT, 0)
-        leaf = Leaf(x, y)
-        leaves.add(leaf)
-
-def spawn_dog_for_difficulty(difficulty):
-    global dog_candidate_platforms
-    
-    # Cap concurrent dogs
-    max_concurrent = max(0, difficulty)
-    if len(dogs) >= max_concurrent:
-        return
-    if not dog_candidate_platforms:
-        return
-
-    occupied_indices = [getattr(d.platform, "spawn_index", None) for d in dogs]
-
-    def allowed(p):
-        if any(getattr(d, "platform", None) is p for d in dogs):
-            return False
-        if p.rect.colliderect(kitty.rect):
-            return False
-        idx = getattr(p, "spawn_index", None)
-        if idx is None:
-            return True
-        for occ in occupied_indices:
-            if occ is None: continue
-            if abs(idx - occ) <= 1:
-                return False
-        return True
-
-    spawn_buffer = 50
-    offscreen_candidates = [p for p in dog_candidate_platforms if p.rect.bottom < -spawn_buffer and allowed(p)]
-    
-    candidates = offscreen_candidates
-    if not candidates:
-        return
-
-    platform = random.choice(candidates)
-    dog = Dog(platform)
-    platform = random.choice(candidates)
-    dog = Dog(platform)
-    dogs.add(dog)
-
-def spawn_eagle_logic():
-    global next_eagle_spawn_time
-    
-    # Cap concurrent eagles to 1 for now to avoid chaos
-    if len(eagles) >= 1:
-        return
-
-    eagle = Eagle(kitty)
-    eagles.add(eagle)
-    
-    # Schedule next spawn
-    wait_time = random.randint(5000, 10000) # 5-10 seconds
-    next_eagle_spawn_time = pygame.time.get_ticks() + wait_time
-
-def restart_current_level(regenerate=False):
-    global camera_offset, level_complete, final_platform_data, dog_candidate_platforms, next_dog_spawn_time, kitty, current_level, lives
-
-    camera_offset = 0
-    kitty.rect.midbottom = (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50)
-    kitty.velocity = 0
-    kitty.falling = False
-    kitty.jump = False
-    level_complete = False
-
-    max_plats = 11 if current_level == 1 else 10
-
-    if regenerate:
-        platforms.empty()
-        all_sprites.empty()
-        all_sprites.add(kitty)
-        all_sprites.add(kitty)
-        dogs.empty()
-        eagles.empty()
-        
-        plat_data_list, temp_final = generate_platforms(
-            max_plats, SCREEN_WIDTH, SCREEN_HEIGHT,
-            level=current_level, difficulty=current_difficulty
-        )
-        
-        for i, p_data in enumerate(plat_data_list):
-            new_platform = Platform(p_data, branch_image)
-            if i == len(plat_data_list) - 1:
-                new_platform.is_final = True
-            platforms.add(new_platform)
-            all_sprites.add(new_platform)
-            
-        ground = create_ground()
-        platforms.add(ground)
-        all_sprites.add(ground)
-        
-        final_platform_data = temp_final
-        
-        # Recompute candidates
-        dog_candidate_platforms = setup_dog_spawn_candidates(platforms.sprites(), SCREEN_HEIGHT)
-
-    # Reset spawn time
-    base = {1: 8000, 2: 5000, 3: 3000}.get(current_difficulty, 5000)
-    # Reset spawn time
-    base = {1: 8000, 2: 5000, 3: 3000}.get(current_difficulty, 5000)
-    now = pygame.time.get_ticks()
-    next_dog_spawn_time = now + random.randint(int(base*0.5), int(base*1.5))
-    next_eagle_spawn_time = now + random.randint(5000, 10000)
-
-def start_new_level():
-    global current_level
-    if current_level < max_levels:
-        current_level += 1
-    else:
-        print("All levels complete! You Win!")
-        pygame.time.delay(3000)
-        current_level = 1
-    
-    restart_current_level(regenerate=True)
+# Rendered text and static screens, built on first use and then reused
+surface_cache = SurfaceCache()
+
+# The scene is drawn into `view`: the window itself, or with a render scale
+# below 1 a low-resolution ScaledCanvas stretched to the window each frame
+# (see set_render_scale). The HUD stays at window resolution unless
+# native_hud is off.
+view = screen
+canvas = None
+native_hud = True
+
+# Load Images and Sounds on a worker thread while the splash screen is up:
+# what a level needs first, then the splash art (a title screen stands in
+# until it is loaded) and music.
+# Images are converted to the display format by the asset registry.
+def load_music():
+    mixer.music.load('assets/BGM.ogg')
+    mixer.music.play(-1)  # Loop music
+
+loader = AssetLoader()
+loader.add("branch", lambda: assets.image('assets/branch.png'))
+loader.add("platform_textures", lambda: prerender_platform_textures(loader.result("branch")))
+# Only the visible band of the background is blitted each frame
+loader.add("background", lambda: BackgroundRenderer(
+    assets.image('assets/Background_lvl1.png', (SCREEN_WIDTH, 3 * SCREEN_HEIGHT), alpha=False),
+    origin_y=-1.5 * SCREEN_HEIGHT))
+loader.add("kitty_mini", lambda: assets.image('assets/kitty.png', (40, 40)))
+loader.add("sprites", preload_images)
+loader.add("sounds", lambda: [assets.sound(path) for path in ('assets/hiss.wav', 'assets/meow.wav', 'assets/meow2.wav')])
+loader.add("splash", lambda: assets.image('assets/Kitty_splash.png', (SCREEN_WIDTH, SCREEN_HEIGHT // 2), alpha=False))
+loader.add("music", load_music)
+# The first level can start once these are in; music may still be loading
+LEVEL_ASSETS = ("branch", "platform_textures", "background", "kitty_mini", "sprites", "sounds")
+
+# Set from the loader by use_level_assets()
+branch_image = background = kitty_mini = hiss_sound = None
+meow_sounds = []
+hud = None
+
+# Seconds from startup_begin to the first frame, to the level assets being
+# loaded and to the first frame of the first level
+startup_times = {}
+
+# Game State
+world = None  # World instance, created in main_game()
+recorder = None  # replay.Recorder when started with --record
+record_path = None
+restart_requested = False  # Set by the game-over screen, fed to the next step
+
+# Frame-phase profiler: F3 toggles it with an overlay, --profile PATH
+# enables it from the start and dumps the timings on exit
+profiler = FrameProfiler()
+profiler_overlay = ProfilerOverlay(profiler, pygame.font.SysFont("monospace", 18))
+profile_path = None
+
+def use_level_assets():
+    global branch_image, background, kitty_mini, hiss_sound, meow_sounds, hud
+    branch_image = loader.result("branch")
+    background = loader.result("background")
+    kitty_mini = loader.result("kitty_mini")
+    hiss_sound, *meow_sounds = loader.result("sounds")
+
+    # HUD: the strip and its texts are kept between frames; widgets re-render
+    # only when their value changes. FPS shows while the profiler is on.
+    hud = Hud((SCREEN_WIDTH, 50), cache=surface_cache)
+    hud.add(TextWidget(font_small, lambda: world.current_level, (10, 10), "Level: {}"))
+    hud.add(IconRowWidget(kitty_mini, lambda: world.lives, SCREEN_WIDTH, 5))
+    hud.add(TextWidget(font_small, lambda: round(clock.get_fps()) if profiler.enabled else None,
+                       (SCREEN_WIDTH // 2, 10), "FPS: {}", anchor="midtop"))
+
+def mark_startup(name):
+    if name not in startup_times:
+        startup_times[name] = time.perf_counter() - startup_begin
+
+def report_startup():
+    print("Startup: " + ", ".join(f"{name.replace('_', ' ')} {seconds * 1000:.0f} ms"
+                                  for name, seconds in startup_times.items()))
+
+def quit_game():
+    if recorder is not None:
+        recorder.save(record_path)
+        print(f"Recording saved to {record_path}")
+    if profile_path is not None:
+        profiler.dump(profile_path)
+        print(f"Frame profile saved to {profile_path}")
+    pygame.quit()
+    sys.exit()
 
 # ------------------ Screens -------------------------
+def build_splash_screen():
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    surface.fill(SKY_BLUE)
+    splash_image = loader.result("splash")
+    surface.blit(splash_image, splash_image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)))
+    return surface
+
+def build_loading_screen():
+    # Shown for the first frames, until the splash art has loaded
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    surface.fill(SKY_BLUE)
+    title_text = surface_cache.text(font_large, "Kitty Adventure", BLACK)
+    surface.blit(title_text, ((SCREEN_WIDTH - title_text.get_width()) // 2, SCREEN_HEIGHT // 3))
+    return surface
+
+def draw_progress(surface, progress):
+    bar = pygame.Rect(0, 0, SCREEN_WIDTH // 2, 12)
+    bar.midbottom = (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40)
+    pygame.draw.rect(surface, WHITE, bar)
+    pygame.draw.rect(surface, BLACK, (bar.x, bar.y, round(bar.width * progress), bar.height))
+    pygame.draw.rect(surface, BLACK, bar, 1)
+
+def build_game_over_screen():
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    surface.fill(SKY_BLUE)
+    game_over_text = surface_cache.text(font_large, "Game Over!", (255, 0, 0))
+    restart_text = surface_cache.text(font_small, "Press R to Restart or Q to Quit", BLACK)
+    surface.blit(game_over_text, ((SCREEN_WIDTH - game_over_text.get_width()) // 2, SCREEN_HEIGHT // 3))
+    surface.blit(restart_text, ((SCREEN_WIDTH - restart_text.get_width()) // 2, SCREEN_HEIGHT // 2))
+    return surface
+
 def splash_screen():
-    splash_running = True
-    while splash_running:
+    """
+    Show the splash while `loader` works, with a progress bar until the
+    level assets are in. A key pressed before then starts the game as soon
+    as they are.
+    """
+    started = False
+    level_ready = False
+    while True:
         for event in pygame.event.get():
             if event.type == QUIT:
-                pygame.quit()
-                sys.exit()
+                quit_game()
             elif event.type == KEYDOWN or event.type == MOUSEBUTTONDOWN:
-                splash_running = False
-        screen.fill(SKY_BLUE)
-        splash_rect = splash_image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        screen.blit(splash_image, splash_rect)
+                started = True
+        if not level_ready and loader.ready(*LEVEL_ASSETS):
+            level_ready = True
+            mark_startup("assets_ready")
+            use_level_assets()
+        if started and level_ready:
+            # The splash art is only shown here; don't let it slow the level down
+            loader.cancel("splash")
+            break
+
+        if loader.ready("splash"):
+            screen.blit(surface_cache.get("splash", build_splash_screen), (0, 0))
+        else:
+            screen.blit(surface_cache.get("loading", build_loading_screen), (0, 0))
+        if not level_ready:
+            draw_progress(screen, loader.progress(*LEVEL_ASSETS))
         pygame.display.flip()
+        mark_startup("first_frame")
         clock.tick(FPS)
 
 def game_over_screen():
-    global lives, current_level
+    global restart_requested
     over = True
     while over:
         for event in pygame.event.get():
             if event.type == QUIT:
-                pygame.quit()
-                sys.exit()
+                quit_game()
             elif event.type == KEYDOWN:
                 if event.key == K_r:
-                    lives = 3
-                    current_level = 1
-                    restart_current_level(regenerate=True)
+                    # The restart goes through the simulation as an input so
+                    # recordings replay it too
+                    restart_requested = True
                     over = False
                 elif event.key == K_q:
-                    pygame.quit()
-                    sys.exit()
+                    quit_game()
 
-        screen.fill(SKY_BLUE)
-        screen.blit(game_over_text, ((SCREEN_WIDTH - game_over_text.get_width()) // 2, SCREEN_HEIGHT // 3))
-        screen.blit(restart_text, ((SCREEN_WIDTH - restart_text.get_width()) // 2, SCREEN_HEIGHT // 2))
+        screen.blit(surface_cache.get("game_over", build_game_over_screen), (0, 0))
         pygame.display.flip()
         clock.tick(FPS)
 
+def set_render_scale(scale, hud_native=True):
+    global view, canvas, native_hud
+    if not 0 < scale <= 1:
+        raise ValueError(f"render scale must be above 0 and at most 1, not {scale}")
+    canvas = ScaledCanvas(screen.get_size(), scale) if scale < 1 else None
+    view = canvas if canvas is not None else screen
+    native_hud = hud_native
+
 def draw_hud():
-    hud_background = pygame.Surface((SCREEN_WIDTH, 50), pygame.SRCALPHA)
-    hud_background.fill((255, 255, 255, 180))
-    screen.blit(hud_background, (0, 0))
-    level_hud = font_small.render(f"Level: {current_level}", True, BLACK)
-    screen.blit(level_hud, (10, 10))
-    for i in range(lives):
-        screen.blit(kitty_mini, (SCREEN_WIDTH - (i + 1) * 45, 5))
+    hud.draw(screen if native_hud else view)
+
+def draw_frame():
+    """The scene and HUD, presented to the window (not flipped)."""
+    draw_world()
+    if canvas is not None:
+        if not native_hud:
+            draw_hud()
+        canvas.present(screen)
+        profiler.mark("present")
+        if native_hud:
+            draw_hud()
+    else:
+        draw_hud()
+
+def present_events(events):
+    """Play sounds, pauses and screens for the events of one simulation step."""
+    if "hit_dog" in events or "hit_eagle" in events:
+        try:
+            hiss_sound.play()
+        except Exception:
+            pass
+    if "level_complete" in events:
+        print("Level complete!")
+        congrats_text = surface_cache.text(font_large, "Congratulations Kitty!", (184, 134, 11))
+        screen.blit(congrats_text, ((SCREEN_WIDTH - congrats_text.get_width()) // 2, SCREEN_HEIGHT // 2))
+        pygame.display.flip()
+        pygame.time.delay(2000)
+    if "game_won" in events:
+        print("All levels complete! You Win!")
+        pygame.time.delay(3000)
+    if "game_over" in events:
+        game_over_screen()
+    elif "hit_dog" in events:
+        pygame.time.delay(800)
+    elif "fell" in events or "hit_eagle" in events:
+        pygame.time.delay(1000)
+
+# The scene, back to front. Layers look up the current world and
+# background when drawn, so they survive level restarts; each sprite layer
+# only asks the world's spatial indexes for what is on screen. The HUD is
+# drawn on top by draw_frame.
+scene = Renderer([
+    DrawLayer("background", lambda surface, camera: background.draw(surface, camera.offset), phase="background"),
+    DrawLayer("leaves", lambda surface, camera: world.leaves.draw(surface, camera.offset)),
+    SpriteLayer("platforms", lambda view: world.platform_index.query_rect(view)),
+    SpriteLayer("enemies", lambda view: world.enemy_index.query_rect(view)),
+    SpriteLayer("player", lambda view: (world.kitty,), phase="sprites"),  # Always drawn
+])
+
+def draw_world():
+    scene.draw(view, world.camera, profiler)
 
 # ------------------ Main Game Loop ----------------------------
-def main_game():
-    global camera_offset, camera_follow_kitty, time_elapsed, level_complete, lives, next_dog_spawn_time, next_eagle_spawn_time, kitty, dog_candidate_platforms
-    
-    # Init Kitty
-    kitty = Kitty(meow_sounds)
-    all_sprites.add(kitty)
-    
-    # Init Level 1
-    restart_current_level(regenerate=True)
-    initialize_leaves()
-    
+def main_game(endless=False, seed=None, record=None, profile=None, level_pack=None):
+    global world, recorder, record_path, restart_requested, profile_path
+
+    world = World(level=1 if endless else 5, difficulty=2, branch_image=branch_image,
+                  meow_sounds=meow_sounds, endless=endless, seed=seed,
+                  level_pack=level_pack)
+    world.profiler = profiler
+    if profile:
+        profile_path = profile
+        profiler.set_enabled(True)
+    if record:
+        recorder = Recorder(world)
+        record_path = record
+
+    # Edge inputs seen since the last simulation step
+    jump_pressed = False
+    jump_released = False
+    accumulator = 0.0
+
     running = True
     while running:
-        dt = clock.tick(FPS) / 1000.0
-        time_elapsed += dt
-        
-        breeze_strength = get_breeze_strength(time_elapsed)
-        
+        accumulator += min(clock.tick(FPS) / 1000.0, MAX_FRAME_TIME)
+        profiler.begin_frame()
+
         for event in pygame.event.get():
             if event.type == QUIT:
-                pygame.quit()
-                sys.exit()
+                quit_game()
             elif event.type == KEYDOWN:
                 if event.key == K_SPACE:
-                    kitty.do_jump()
+                    jump_pressed = True
+                elif event.key == K_F3:
+                    profiler.toggle()
             elif event.type == KEYUP:
                 if event.key == K_SPACE:
-                    kitty.stop_jump()
-
-        pressed_keys = pygame.key.get_pressed()
-        kitty.update(pressed_keys, platforms, breeze_strength)
-
-        # Update platforms
-        for platform in platforms:
-            platform.update(breeze_strength, time_elapsed)
-            
-        leaves.update(breeze_strength, dt)
-        
-        # Camera
-        if kitty.jump and kitty.rect.top <= SCREEN_HEIGHT / 2:
-            camera_follow_kitty = True
-        
-        if camera_follow_kitty and not kitty.falling:
-            camera_movement = max(0, (SCREEN_HEIGHT / 2) - kitty.rect.top) * 0.1
-            camera_offset += camera_movement
-            kitty.rect.y += camera_movement
-            for platform in platforms:
-                platform.rect.y += camera_movement
-                platform.base_y += camera_movement
-            for leaf in leaves:
-                leaf.rect.y += camera_movement
-                leaf.y += camera_movement
-            for eagle in eagles:
-                eagle.rect.y += camera_movement
-
-        if kitty.falling:
-            camera_follow_kitty = False
-
-        # Life Lost
-        if kitty.rect.top > SCREEN_HEIGHT:
-            lives -= 1
-            if lives > 0:
-                pygame.time.delay(1000)
-                restart_current_level(regenerate=True)
-                continue
-            else:
-                game_over_screen()
-                continue
-
-        # Collision with Platforms
-        collisions = pygame.sprite.spritecollide(kitty, platforms, False)
-        for platform in collisions:
-             if kitty.velocity >= 0 and kitty.previous_rect.bottom <= platform.rect.top and kitty.rect.bottom >= platform.rect.top:
-                kitty.falling = False
-                kitty.velocity = 0
-                kitty.rect.bottom = platform.rect.top
-                
-                # Check level complete
-                if getattr(platform, 'is_final', False) and not level_complete:
-                    level_complete = True
-                    print("Level complete!")
-                    screen.blit(congrats_text, ((SCREEN_WIDTH - congrats_text.get_width()) // 2, SCREEN_HEIGHT // 2))
-                    pygame.display.flip()
-                    pygame.time.delay(2000)
-                    start_new_level()
-                    break
-
-                dx = platform.rect.x - platform.prev_rect.x
-                dy = platform.rect.y - platform.prev_rect.y
-                kitty.rect.x += dx
-                kitty.rect.y += dy
+                    jump_released = True
+        profiler.mark("events")
+
+        # Fixed-timestep simulation: run as many steps as real time allows
+        while accumulator >= FIXED_DT:
+            accumulator -= FIXED_DT
+            pressed_keys = pygame.key.get_pressed()
+            inputs = Inputs(pressed_keys[K_LEFT], pressed_keys[K_RIGHT], jump_pressed, jump_released,
+                            restart_requested)
+            jump_pressed = jump_released = restart_requested = False
+            events = world.step(inputs, FIXED_DT)
+            if recorder is not None:
+                recorder.record(inputs, world)
+            if events:
+                present_events(events)
+                profiler.skip_frame()
+                # Don't replay time spent on pauses and screens
+                accumulator = 0.0
+                clock.tick()
                 break
 
-        # Dogs
-        for dog in list(dogs):
-            dog.update(dt)
-            
-        # Eagles
-        for eagle in list(eagles):
-            eagle.update(dt)
-
-        # Spawn dogs (Level > 3)
-        if current_level > 3:
-            now = pygame.time.get_ticks()
-            if now >= next_dog_spawn_time:
-                spawn_dog_for_difficulty(current_difficulty)
-                base = {1: 8000, 2: 5000, 3: 3000}.get(current_difficulty, 5000)
-                next_dog_spawn_time = now + random.randint(int(base * 0.5), int(base * 1.5))
-
-        # Spawn eagles (Level >= 5)
-        if current_level >= 5:
-            now = pygame.time.get_ticks()
-            if now >= next_eagle_spawn_time:
-                spawn_eagle_logic()
-
-        # Collision with dogs
-        hit_dog = pygame.sprite.spritecollideany(kitty, dogs)
-        if hit_dog:
-            lives -= 1
-            try:
-                hiss_sound.play()
-            except Exception:
-                pass
-            if lives > 0:
-                pygame.time.delay(800)
-                restart_current_level(regenerate=True)
-                continue
-            else:
-                game_over_screen()
-                continue
-
-        # Collision with Eagles
-        hit_eagle = pygame.sprite.spritecollideany(kitty, eagles)
-        if hit_eagle:
-            lives -= 1
-            try:
-                hiss_sound.play()
-            except Exception:
-                pass
-                
-            if lives > 0:
-                pygame.time.delay(1000)
-                restart_current_level(regenerate=True)
-                continue
-            else:
-                game_over_screen()
-                continue
-
-        # Draw
-        background_y = -1.5 * SCREEN_HEIGHT + (camera_offset % (3 * SCREEN_HEIGHT))
-        screen.blit(background_image, (0, background_y))
-        screen.blit(background_image, (0, background_y + 3 * SCREEN_HEIGHT))
-
-        leaves.draw(screen)
-
-        for entity in all_sprites:
-            if isinstance(entity, Kitty):
-                screen.blit(entity.image, entity.rect)
-            else:
-                if entity.rect.top > -camera_offset:
-                    screen.blit(entity.image, entity.rect)
-
-        for dog in dogs:
-            if -100 < dog.rect.top < SCREEN_HEIGHT + 100:
-                screen.blit(dog.image, dog.rect)
-
-        for eagle in eagles:
-            screen.blit(eagle.image, eagle.rect)
-
-        draw_hud()
+        draw_frame()
+        if profiler.enabled:
+            profiler_overlay.draw(screen)
+        profiler.mark("hud")
         pygame.display.flip()
+        profiler.mark("flip")
+        profiler.end_frame()
+        if "playable" not in startup_times:
+            mark_startup("first_frame")
+            mark_startup("playable")
+            report_startup()
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Kitty Adventure")
+    parser.add_argument("--endless", action="store_true", help="play the endless tower")
+    parser.add_argument("--seed", type=seed_arg, default=None, help="seed for a reproducible game")
+    parser.add_argument("--record", metavar="PATH", help="record inputs to PATH for replay.py")
+    parser.add_argument("--profile", metavar="PATH", help="profile frame phases, dump to PATH (.csv or .json) on exit")
+    parser.add_argument("--levels", metavar="PATH", help="play levels from a level pack (see level_pack.py)")
+    parser.add_argument("--render-scale", type=scale_arg, default=1.0, metavar="SCALE",
+                        help="draw the scene at SCALE x the window resolution (e.g. 0.5) and stretch it")
+    parser.add_argument("--scaled-hud", action="store_true", help="draw the HUD at the render scale too")
+    args = parser.parse_args()
+
+    set_render_scale(args.render_scale, hud_native=not args.scaled_hud)
+
+    loader.start()
     splash_screen()
-    main_game()
+    main_game(endless=args.endless, seed=args.seed, record=args.record, profile=args.profile,
+              level_pack=LevelPack.open(args.levels) if args.levels else None)
@@ -0,0 +1,106 @@
+import numpy as np
+from constants import *
+from sprites import leaf_frame, LEAF_ANGLE_FRAMES
+from render_scale import blit_array
+
+LEAF_SIZES = range(5, 16)
+
+# Shared atlas of every pre-rotated leaf frame, built on first use.
+# Frames are stored flat: variant * LEAF_ANGLE_FRAMES + angle_index, where a
+# variant is one (size, color) pair.
+_atlas = None
+_atlas_half_sizes = None
+
+
+def leaf_atlas():
+    """Return (frames, half_sizes) for all leaf variants and angles."""
+    global _atlas, _atlas_half_sizes
+    if _atlas is None:
+        frames = []
+        for size in LEAF_SIZES:
+            for color in FALL_COLORS:
+                for angle_index in range(LEAF_ANGLE_FRAMES):
+                    frames.append(leaf_frame(size, color, angle_index))
+        _atlas = frames
+        _atlas_half_sizes = np.array([f.get_size() for f in frames], dtype=np.float32) / 2
+    return _atlas, _atlas_half_sizes
+
+
+class LeafField:
+    """
+    Falling leaves stored as NumPy arrays (one entry per leaf) instead of one
+    Sprite each. Motion matches `sprites.Leaf` but every leaf is integrated,
+    reset and drawn in a handful of vectorized operations per frame.
+    Positions are in world coordinates; pass the camera offset to `update`
+    and `draw`.
+    """
+
+    def __init__(self, count=MAX_LEAVES, rng=None):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.frames, self.half_sizes = leaf_atlas()
+        self.frame_objects = np.empty(len(self.frames), dtype=object)
+        self.frame_objects[:] = self.frames
+        n = count
+
+        self.variant = self.rng.integers(0, len(LEAF_SIZES) * len(FALL_COLORS), n)
+        self.x = self.rng.integers(0, SCREEN_WIDTH, n, endpoint=True).astype(np.float32)
+        self.y = self.rng.integers(-SCREEN_HEIGHT, 0, n, endpoint=True).astype(np.float32)
+        self.angle = self.rng.uniform(0, 360, n).astype(np.float32)
+        self.rotation_speed = self.rng.uniform(-2, 2, n).astype(np.float32)
+        self.fall_speed = self.rng.uniform(1, 2, n).astype(np.float32)
+        self.oscillation_phase = self.rng.uniform(0, 2 * np.pi, n).astype(np.float32)
+        self.oscillation_speed = self.rng.uniform(1, 3, n).astype(np.float32)
+        self.frame_index = np.zeros(n, dtype=np.int64)
+        self._update_frames()
+
+    def __len__(self):
+        return len(self.x)
+
+    def _update_frames(self):
+        angle_index = np.rint(self.angle / LEAF_ANGLE_STEP).astype(np.int64) % LEAF_ANGLE_FRAMES
+        self.frame_index = self.variant * LEAF_ANGLE_FRAMES + angle_index
+
+    def update(self, breeze_strength, dt, camera_offset=0):
+        if not len(self.x):
+            return  # Leaves off (headless runs)
+        horizontal_speed = breeze_strength * 1.5
+
+        # Oscillating motion
+        oscillation = np.sin(self.oscillation_phase) * 0.5
+        self.oscillation_phase += self.oscillation_speed * dt
+
+        self.x += (horizontal_speed + oscillation) * (dt * 10)
+        self.y += self.fall_speed * (dt * 60)
+        self.angle += (self.rotation_speed + breeze_strength * 0.5) * (dt * 60)
+        self._update_frames()
+
+        # Reset leaves that left the screen, or were left far above it when
+        # the camera jumped back down (level restart)
+        half = self.half_sizes[self.frame_index]
+        screen_y = self.y + camera_offset
+        gone = ((self.x + half[:, 0] < 0) | (self.x - half[:, 0] > SCREEN_WIDTH) |
+                (screen_y - half[:, 1] > SCREEN_HEIGHT) |
+                (screen_y + half[:, 1] < -2 * SCREEN_HEIGHT))
+        if gone.any():
+            self.reset(np.flatnonzero(gone), camera_offset)
+
+    def reset(self, idx, camera_offset=0):
+        """Send the leaves at `idx` back to the top of the screen."""
+        n = len(idx)
+        self.x[idx] = self.rng.integers(0, SCREEN_WIDTH, n, endpoint=True)
+        self.y[idx] = -50 - camera_offset
+        self.angle[idx] = self.rng.uniform(0, 360, n)
+        self.rotation_speed[idx] = self.rng.uniform(-2, 2, n)
+        self.fall_speed[idx] = self.rng.uniform(1, 2, n)
+        self._update_frames()
+
+    def draw(self, surface, camera_offset=0):
+        half = self.half_sizes[self.frame_index]
+        screen_y = self.y + camera_offset
+        # Leaves still waiting above the screen are skipped
+        visible = np.flatnonzero(screen_y + half[:, 1] >= 0)
+        half = half[visible]
+        topleft = np.empty((len(visible), 2), dtype=np.int32)
+        topleft[:, 0] = self.x[visible] - half[:, 0]
+        topleft[:, 1] = screen_y[visible] - half[:, 1]
+        blit_array(surface, self.frame_objects, self.frame_index[visible], topleft)
@@ -0,0 +1,199 @@
+"""
+Level packs: curated or pre-generated levels stored as packed fixed-width
+records, so a tuned level can be shipped and replayed instead of being
+re-rolled on every restart.
+
+A pack is a header, a table of levels, then every level's platform
+records and enemy spawn records back to back. `LevelPack.open` maps the
+file and hands out NumPy views into it, so picking a level is O(1) and
+copies nothing:
+
+    python level_pack.py build levels.klp --variants 100
+    python level_pack.py info levels.klp
+    python kitty.py --levels levels.klp
+"""
+import hashlib
+import mmap
+import random
+import struct
+from collections import namedtuple
+
+import numpy as np
+from constants import *
+from level_utils import generate_platforms, dog_spawn_order
+from reachability import repair_platforms
+
+MAGIC = b"KLVL"
+VERSION = 1
+# magic, version, levels, platform records, spawn records
+HEADER = struct.Struct("<4sHIII")
+
+LEVEL_RECORD = np.dtype([
+    ("level", "<u2"), ("difficulty", "<u2"),
+    ("platform_start", "<u4"), ("platform_count", "<u2"),
+    ("spawn_start", "<u4"), ("spawn_count", "<u2"),
+])
+PLATFORM_RECORD = np.dtype([
+    ("x", "<i2"), ("y", "<i4"), ("width", "<i2"), ("height", "<i2"),
+    ("flags", "u1"), ("spawn_index", "<i2"),  # -1: no dogs spawn here
+])
+SPAWN_RECORD = np.dtype([
+    ("time", "<u4"),      # ms after the level starts
+    ("kind", "u1"),
+    ("platform", "<i2"),  # Index into the level's platforms (dogs), else -1
+])
+
+# Platform flags
+FINAL, GROUND = 1, 2
+# Spawn kinds
+DOG, EAGLE = 0, 1
+# Dog spawn platform: any one World's spawn rules allow at the time
+ANY_PLATFORM = -1
+
+PackedLevel = namedtuple("PackedLevel", "level difficulty platforms spawns")
+
+
+class LevelPack:
+    """
+    Read-only view of a level pack. `pack[i]` is a PackedLevel whose
+    `platforms` and `spawns` are structured NumPy arrays viewing the pack's
+    buffer (normally an mmap, see `open`).
+    """
+
+    def __init__(self, buffer, path=None):
+        self.buffer = buffer
+        self.path = path
+        magic, version, levels, platforms, spawns = HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"not a version {VERSION} Kitty level pack")
+        offset = HEADER.size
+        self.levels = np.frombuffer(buffer, LEVEL_RECORD, levels, offset)
+        offset += levels * LEVEL_RECORD.itemsize
+        self.platforms = np.frombuffer(buffer, PLATFORM_RECORD, platforms, offset)
+        offset += platforms * PLATFORM_RECORD.itemsize
+        self.spawns = np.frombuffer(buffer, SPAWN_RECORD, spawns, offset)
+
+        # (level, difficulty) -> pack indices, for picking a variant
+        self.variants = {}
+        for i, key in enumerate(zip(self.levels["level"].tolist(), self.levels["difficulty"].tolist())):
+            self.variants.setdefault(key, []).append(i)
+
+    @classmethod
+    def open(cls, path):
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), path)
+
+    def digest(self):
+        """64-bit hash of the pack's contents, to tell packs apart."""
+        return int.from_bytes(hashlib.blake2b(self.buffer, digest_size=8).digest(), "little")
+
+    def close(self):
+        # Views must go before the map can close
+        self.levels = self.platforms = self.spawns = None
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+    def __len__(self):
+        return len(self.levels)
+
+    def __getitem__(self, index):
+        level, difficulty, p_start, p_count, s_start, s_count = self.levels[index].item()
+        return PackedLevel(level, difficulty, self.platforms[p_start:p_start + p_count],
+                           self.spawns[s_start:s_start + s_count])
+
+    def find(self, level, difficulty):
+        """Pack indices of the variants of `level` at `difficulty` (maybe empty)."""
+        return self.variants.get((level, difficulty), [])
+
+
+def write_pack(path, levels):
+    """
+    Write `levels`, an iterable of (level, difficulty, platforms, spawns),
+    where platforms are (x, y, width, height, flags, spawn_index) and
+    spawns (time_ms, kind, platform_index) tuples.
+    """
+    table, platform_chunks, spawn_chunks = [], [], []
+    platform_total = spawn_total = 0
+    for level, difficulty, platforms, spawns in levels:
+        table.append((level, difficulty, platform_total, len(platforms), spawn_total, len(spawns)))
+        platform_chunks.append(np.array(platforms, dtype=PLATFORM_RECORD))
+        spawn_chunks.append(np.array(spawns, dtype=SPAWN_RECORD))
+        platform_total += len(platforms)
+        spawn_total += len(spawns)
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(table), platform_total, spawn_total))
+        f.write(np.array(table, dtype=LEVEL_RECORD).tobytes())
+        for chunk in platform_chunks:
+            f.write(chunk.tobytes())
+        for chunk in spawn_chunks:
+            f.write(chunk.tobytes())
+
+
+def spawn_schedule(level, difficulty, candidates, duration=120000, rng=random):
+    """
+    A spawn table following World's random spawning rules: dogs from level
+    4 on at the difficulty's interval, eagles from level 5 every
+    EAGLE_SPAWN_INTERVAL. Dogs are left to pick their platform when they
+    spawn (ANY_PLATFORM), like random spawning does, as which platforms
+    are off screen and free depends on play. World repeats the table once
+    it runs out, so `duration` only sets how long before it repeats.
+    """
+    spawns = []
+    if level > 3 and candidates:
+        base = DOG_SPAWN_BASE.get(difficulty, 5000)
+        t = rng.randint(int(base * 0.5), int(base * 1.5))
+        while t < duration:
+            spawns.append((t, DOG, ANY_PLATFORM))
+            t += rng.randint(int(base * 0.5), int(base * 1.5))
+    if level >= 5:
+        t = rng.randint(*EAGLE_SPAWN_INTERVAL)
+        while t < duration:
+            spawns.append((t, EAGLE, -1))
+            t += rng.randint(*EAGLE_SPAWN_INTERVAL)
+    spawns.sort()
+    return spawns
+
+
+def generated_levels(levels=range(1, 11), difficulties=(1, 2, 3), variants=10, seed=0):
+    """Yield pack entries made with `generate_platforms`, repaired for reachability."""
+    rng = random.Random(seed)
+    for level in levels:
+        for difficulty in difficulties:
+            for _ in range(variants):
+                data, _ = generate_platforms(11 if level == 1 else 10, SCREEN_WIDTH, SCREEN_HEIGHT,
+                                             level=level, difficulty=difficulty, rng=rng)
+                data, _, _ = repair_platforms(data, GROUND_PLATFORM)
+                spawn_index = [-1] * len(data)
+                order = dog_spawn_order(data, SCREEN_HEIGHT)
+                for idx, i in enumerate(order):
+                    spawn_index[i] = idx
+                platforms = [(x, y, w, h, 0, spawn_index[i]) for i, (x, y, w, h) in enumerate(data)]
+                x, y, w, h, _, s = platforms[-1]
+                platforms[-1] = (x, y, w, h, FINAL, s)
+                platforms.append(GROUND_PLATFORM + (GROUND, -1))
+                yield level, difficulty, platforms, spawn_schedule(level, difficulty, order, rng=rng)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Build or inspect Kitty level packs.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="generate a pack")
+    build.add_argument("path")
+    build.add_argument("--variants", type=int, default=10, help="levels per level/difficulty pair")
+    build.add_argument("--seed", type=int, default=0)
+    info = sub.add_parser("info", help="summarize a pack")
+    info.add_argument("path")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        start = time.perf_counter()
+        write_pack(args.path, generated_levels(variants=args.variants, seed=args.seed))
+        print(f"wrote {args.path} in {time.perf_counter() - start:.2f}s")
+    pack = LevelPack.open(args.path)
+    print(f"{len(pack)} levels, {len(pack.platforms)} platforms, {len(pack.spawns)} spawns, "
+          f"{len(pack.variants)} level/difficulty pairs")
+    pack.close()
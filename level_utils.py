@@ -14,11 +14,13 @@ def get_breeze_strength(time_elapsed):
     
     return base_strength + variability * math.sin(cycle_speed * time_elapsed)
 
-def generate_platforms(max_platforms, screen_width, screen_height, level=1, difficulty=1):
+def platform_ranges(level, difficulty, progress_fraction):
     """
-    Generates platforms that start large and close together, and become smaller and further apart.
+    Width and vertical gap ranges for a platform `progress_fraction` of the
+    way up a level: platforms start large and close together, and become
+    smaller and further apart.
+    Returns (min_width, max_width, min_gap, max_gap).
     """
-    platforms_data = []
     # Base parameters
     base_min_width = 100
     base_max_width = 200
@@ -26,41 +28,68 @@ def generate_platforms(max_platforms, screen_width, screen_height, level=1, diff
     base_max_gap = 150
 
     # Adjustments based on level and difficulty:
-    width_adjustment = difficulty * level * 5        # Shrinks platform widths as level increases
-    gap_adjustment   = difficulty * level * 10         # Increases vertical gap as level increases
+    width_adjustment = difficulty * level * PLATFORM_WIDTH_SHRINK  # Shrinks platform widths as level increases
+    gap_adjustment   = difficulty * level * PLATFORM_GAP_GROWTH    # Increases vertical gap as level increases
+
+    current_min_width = max(30, int(base_min_width - width_adjustment * progress_fraction))
+    current_max_width = max(40, int(base_max_width - width_adjustment * progress_fraction))
+    # Interpolate the vertical gap: platforms get further apart toward the top
+    min_gap = base_min_gap + int(gap_adjustment * progress_fraction)
+    max_gap = base_max_gap + int(gap_adjustment * progress_fraction)
+    return current_min_width, current_max_width, min_gap, max_gap
+
+def next_platform(last_platform_y, screen_width, level, difficulty, progress_fraction, rng=random):
+    """Pick the platform above `last_platform_y` as an (x, y, width, height) tuple."""
+    min_width, max_width, min_gap, max_gap = platform_ranges(level, difficulty, progress_fraction)
+    width = rng.randint(min_width, max_width)
+    vertical_gap = rng.randint(min_gap, max_gap)
+    # Randomly align the platform to the left or right edge
+    if rng.choice([True, False]):
+        x_position = 0
+    else:
+        x_position = screen_width - width
+    y_position = last_platform_y - vertical_gap
+    return (x_position, y_position, width, 20)  # 20 is the platform thickness
 
+def generate_platforms(max_platforms, screen_width, screen_height, level=1, difficulty=1, rng=random):
+    """
+    Generates platforms that start large and close together, and become smaller and further apart.
+    """
+    platforms_data = []
     last_platform_y = screen_height  # Start from the bottom
 
     for i in range(max_platforms):
         progress_fraction = i / float(max_platforms)
-        current_min_width = max(30, int(base_min_width - width_adjustment * progress_fraction))
-        current_max_width = max(40, int(base_max_width - width_adjustment * progress_fraction))
-        # Interpolate the vertical gap: platforms get further apart toward the top
-        min_gap = base_min_gap + int(gap_adjustment * progress_fraction)
-        max_gap = base_max_gap + int(gap_adjustment * progress_fraction)
-        width = random.randint(current_min_width, current_max_width)
-        vertical_gap = random.randint(min_gap, max_gap)
-        # Randomly align the platform to the left or right edge
-        if random.choice([True, False]):
-            x_position = 0
-        else:
-            x_position = screen_width - width
-        y_position = last_platform_y - vertical_gap
-        last_platform_y = y_position
-        platform_tuple = (x_position, y_position, width, 20)  # 20 is the platform thickness
+        platform_tuple = next_platform(last_platform_y, screen_width, level, difficulty, progress_fraction, rng)
+        last_platform_y = platform_tuple[1]
         platforms_data.append(platform_tuple)
     final_platform_data = platforms_data[-1]  # The last generated platform is the final one
     return platforms_data, final_platform_data
 
-def setup_dog_spawn_candidates(platforms, screen_height):
-    """Populate `dog_candidate_platforms` with platforms that are above 1/3 of the level height.
-    This computes the vertical span from bottom (SCREEN_HEIGHT) to the topmost platform and
-    selects platforms whose y is above the one-third threshold.
+def stream_platforms(screen_width, start_y, level=1, difficulty=1, chunk_size=10, max_level=10, rng=random):
     """
-    if not platforms:
-        return []
-    # Determine topmost platform y value
-    ys = [p.rect.y for p in platforms if not getattr(p, 'is_ground', False)]
+    Endless version of `generate_platforms`: lazily yields (level, platforms_data)
+    chunks climbing up from `start_y`. Each chunk is one level's worth of
+    platforms built with the same width/gap rules; the level rises by one per
+    chunk and stays at `max_level` from then on.
+    """
+    last_platform_y = start_y
+    while True:
+        chunk = []
+        for i in range(chunk_size):
+            progress_fraction = i / float(chunk_size)
+            platform_tuple = next_platform(last_platform_y, screen_width, level, difficulty, progress_fraction, rng)
+            last_platform_y = platform_tuple[1]
+            chunk.append(platform_tuple)
+        yield level, chunk
+        level = min(level + 1, max_level)
+
+def dog_spawn_order(platforms_data, screen_height):
+    """Indices into `platforms_data` (ground excluded) of the platforms dogs may
+    spawn on, top to bottom: those above 1/3 of the level height, apart from
+    the topmost one.
+    """
+    ys = [p[1] for p in platforms_data]
     if not ys:
         return []
     topmost = min(ys)
@@ -69,17 +98,19 @@ def setup_dog_spawn_candidates(platforms, screen_height):
         return []
 
     threshold = screen_height - (level_span * (1.0 / 3.0))
-    
-    # Candidate platforms: above the threshold, not ground, and strictly lower than the topmost platform
-    candidates = [
-        p for p in platforms 
-        if (p.rect.y < threshold 
-            and not getattr(p, 'is_ground', False) 
-            and p.rect.y > topmost)
-    ]
-    
-    # Sort candidates top-to-bottom and assign spawn index
-    candidates.sort(key=lambda p: p.rect.y)
+    candidates = [i for i, y in enumerate(ys) if topmost < y < threshold]
+    candidates.sort(key=lambda i: ys[i])
+    return candidates
+
+def setup_dog_spawn_candidates(platforms, screen_height):
+    """Populate `dog_candidate_platforms` with platforms that are above 1/3 of the level height.
+    This computes the vertical span from bottom (SCREEN_HEIGHT) to the topmost platform and
+    selects platforms whose y is above the one-third threshold.
+    """
+    platforms = [p for p in platforms if not getattr(p, 'is_ground', False)]
+    candidates = [platforms[i] for i in dog_spawn_order([tuple(p.rect) for p in platforms], screen_height)]
+
+    # Candidates are sorted top-to-bottom; assign spawn index
     for idx, p in enumerate(candidates):
         p.spawn_index = idx
         
@@ -0,0 +1,116 @@
+import numpy as np
+from constants import *
+
+
+def _round_half_away(values):
+    # Matches how pygame.Rect rounds a float coordinate on assignment
+    return np.where(values >= 0, np.floor(values + 0.5), np.ceil(values - 0.5)).astype(np.int64)
+
+
+class PlatformMotion:
+    """
+    Breeze sway and undulation for every platform in the level, stored as
+    NumPy arrays (one slot per platform) and advanced in one vectorized step
+    per frame. Motion matches what `Platform.update` used to do per sprite.
+
+    `step()` writes back only the rects whose integer position changed and
+    returns those platforms, so callers re-index just the movers. `delta()`
+    gives a platform's movement over the last step, for carrying Kitty.
+    """
+
+    _FIELDS = (
+        ("original_x", np.float64), ("base_y", np.float64),
+        ("phase", np.float64), ("offset_phase", np.float64),
+        ("undulates", bool),  # False for the ground
+        ("x", np.int64), ("y", np.int64),  # Position last written to the rect
+        ("dx", np.int64), ("dy", np.int64),
+    )
+
+    def __init__(self, capacity=64):
+        self.platforms = []  # slot -> platform
+        self.slots = {}      # platform -> slot
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        n = len(self.platforms)
+        for name, dtype in self._FIELDS:
+            array = np.zeros(capacity, dtype=dtype)
+            old = getattr(self, name, None)
+            if old is not None:
+                array[:n] = old[:n]
+            setattr(self, name, array)
+
+    def __len__(self):
+        return len(self.platforms)
+
+    def __contains__(self, platform):
+        return platform in self.slots
+
+    def add(self, platform):
+        """Start moving `platform` from its freshly reset kinematics."""
+        i = len(self.platforms)
+        if i == len(self.x):
+            self._allocate(2 * i)
+        self.platforms.append(platform)
+        self.slots[platform] = i
+        self.original_x[i] = platform.original_x
+        self.base_y[i] = platform.base_y
+        self.phase[i] = platform.phase
+        self.offset_phase[i] = platform.offset_phase
+        self.undulates[i] = not platform.is_ground
+        self.x[i], self.y[i] = platform.rect.topleft
+        self.dx[i] = self.dy[i] = 0
+
+    def remove(self, platform):
+        i = self.slots.pop(platform, None)
+        if i is None:
+            return
+        # Move the last slot into the hole
+        last = len(self.platforms) - 1
+        moved = self.platforms.pop()
+        if i != last:
+            self.platforms[i] = moved
+            self.slots[moved] = i
+            for name, _ in self._FIELDS:
+                array = getattr(self, name)
+                array[i] = array[last]
+
+    def clear(self):
+        self.platforms.clear()
+        self.slots.clear()
+
+    def delta(self, platform):
+        """(dx, dy) the platform moved during the last step."""
+        i = self.slots[platform]
+        return int(self.dx[i]), int(self.dy[i])
+
+    def step(self, breeze_strength, time_elapsed, dt=FIXED_DT):
+        """Advance every platform; return the ones whose rect moved."""
+        n = len(self.platforms)
+        if not n:
+            return []
+        undulates = self.undulates[:n]
+        phase = self.phase[:n]
+        phase[undulates] += 0.05 * dt * FPS  # 0.05 per 60 Hz frame, for undulation timing
+
+        # Horizontal sway for all, vertical undulation for all but the ground
+        new_x = _round_half_away(self.original_x[:n] + breeze_strength * np.sin(time_elapsed + self.offset_phase[:n]))
+        new_y = np.where(undulates, _round_half_away(self.base_y[:n] + breeze_strength * np.sin(phase)), self.y[:n])
+
+        dx = self.dx[:n]
+        dy = self.dy[:n]
+        np.subtract(new_x, self.x[:n], out=dx)
+        np.subtract(new_y, self.y[:n], out=dy)
+        self.x[:n] = new_x
+        self.y[:n] = new_y
+
+        moved = np.flatnonzero(dx | dy)
+        if not len(moved):
+            return []
+        platforms = self.platforms
+        movers = []
+        for i, x, y in zip(moved.tolist(), new_x[moved].tolist(), new_y[moved].tolist()):
+            platform = platforms[i]
+            platform.rect.topleft = (x, y)
+            movers.append(platform)
+        return movers
@@ -0,0 +1,32 @@
+class SpritePool:
+    """
+    Reuses sprites instead of allocating new ones.
+
+    `acquire(*args)` hands back a released sprite re-initialised in place
+    with `sprite.reset(*args)`, or builds a new one with `factory(*args)`
+    when the pool is empty. `release(sprite)` removes it from all its groups
+    and keeps it for the next `acquire`.
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.free = []
+
+    def __len__(self):
+        return len(self.free)
+
+    def acquire(self, *args):
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args)
+            return sprite
+        return self.factory(*args)
+
+    def release(self, sprite):
+        sprite.kill()
+        self.free.append(sprite)
+
+    def release_all(self, sprites):
+        for sprite in list(sprites):
+            self.release(sprite)
+
@@ -0,0 +1,146 @@
+import csv
+import json
+import time
+
+import numpy as np
+import pygame
+
+# Frame phases in the order they run. World.step marks the simulation ones,
+# kitty.py the input and drawing ones.
+PHASES = (
+    "events", "kitty", "platforms", "camera", "leaves", "collisions",
+    "enemies", "spawning", "background", "sprites", "present", "hud", "flip",
+)
+
+
+def _noop(*args):
+    pass
+
+
+class FrameProfiler:
+    """
+    Per-phase frame timer backed by a fixed-size ring buffer.
+
+    Call `begin_frame()`, then `mark(phase)` as each phase finishes - the
+    time since the previous mark is added to that phase - and `end_frame()`.
+    `skip_frame()` drops the current frame (pauses, modal screens). While
+    disabled all four are bound to a no-op, so instrumented code pays for
+    one empty call per phase.
+    """
+
+    def __init__(self, capacity=600, enabled=False):
+        self.capacity = capacity
+        self.index = {name: i for i, name in enumerate(PHASES)}
+        self.samples = np.zeros((capacity, len(PHASES)), dtype=np.float32)  # ms
+        self.frames = 0  # Frames recorded so far (ring position = frames % capacity)
+        self.row = np.zeros(len(PHASES), dtype=np.float64)
+        self.last = 0.0
+        self.skipping = False
+        self.enabled = False
+        self.set_enabled(enabled)
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        if enabled:
+            self.begin_frame = self._begin_frame
+            self.mark = self._mark
+            self.end_frame = self._end_frame
+            self.skip_frame = self._skip_frame
+            self._begin_frame()
+        else:
+            self.begin_frame = self.mark = self.end_frame = self.skip_frame = _noop
+
+    def toggle(self):
+        self.set_enabled(not self.enabled)
+
+    def _begin_frame(self):
+        self.row[:] = 0
+        self.skipping = False
+        self.last = time.perf_counter()
+
+    def _skip_frame(self):
+        # Frames with pauses or modal screens would swamp the percentiles
+        self.skipping = True
+
+    def _mark(self, phase):
+        now = time.perf_counter()
+        self.row[self.index[phase]] += now - self.last
+        self.last = now
+
+    def _end_frame(self):
+        if self.skipping:
+            return
+        self.samples[self.frames % self.capacity] = self.row * 1000
+        self.frames += 1
+
+    def recent(self):
+        """Recorded frames, oldest first, as an (n, phases) array of ms."""
+        if self.frames < self.capacity:
+            return self.samples[:self.frames]
+        start = self.frames % self.capacity
+        return np.concatenate((self.samples[start:], self.samples[:start]))
+
+    def summary(self):
+        """{phase: {"p50", "p95", "p99", "mean"}} over the buffered frames, in ms."""
+        data = self.recent()
+        if not len(data):
+            return {}
+        p50, p95, p99 = np.percentile(data, (50, 95, 99), axis=0)
+        mean = data.mean(axis=0)
+        totals = data.sum(axis=1)
+        result = {
+            name: {"p50": float(p50[i]), "p95": float(p95[i]), "p99": float(p99[i]), "mean": float(mean[i])}
+            for i, name in enumerate(PHASES)
+        }
+        t50, t95, t99 = np.percentile(totals, (50, 95, 99))
+        result["total"] = {"p50": float(t50), "p95": float(t95), "p99": float(t99), "mean": float(totals.mean())}
+        return result
+
+    def dump(self, path):
+        """Write the buffered frames to `path`: raw CSV, or JSON with a summary."""
+        data = self.recent()
+        if path.endswith(".json"):
+            with open(path, "w") as f:
+                json.dump({"phases": PHASES, "summary": self.summary(),
+                           "frames": np.round(data, 4).tolist()}, f, indent=1)
+        else:
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(PHASES)
+                writer.writerows(np.round(data, 4).tolist())
+
+
+# Shared disabled profiler for code running without one
+NULL_PROFILER = FrameProfiler(capacity=1)
+
+
+class ProfilerOverlay:
+    """On-screen table of rolling p50/p95/p99 per phase, refreshed a few times a second."""
+
+    def __init__(self, profiler, font, refresh_frames=30):
+        self.profiler = profiler
+        self.font = font
+        self.refresh_frames = refresh_frames
+        self.surface = None
+        self.rendered_at = -refresh_frames
+
+    def render(self):
+        summary = self.profiler.summary()
+        lines = [f"{'phase':<11}{'p50':>7}{'p95':>7}{'p99':>7}"]
+        for name in PHASES + ("total",):
+            stats = summary.get(name)
+            if stats:
+                lines.append(f"{name:<11}{stats['p50']:>7.2f}{stats['p95']:>7.2f}{stats['p99']:>7.2f}")
+        line_height = self.font.get_linesize()
+        width = max(self.font.size(line)[0] for line in lines) + 10
+        surface = pygame.Surface((width, line_height * len(lines) + 10), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 170))
+        for i, line in enumerate(lines):
+            surface.blit(self.font.render(line, True, (255, 255, 255)), (5, 5 + i * line_height))
+        self.surface = surface
+
+    def draw(self, screen, topleft=(10, 60)):
+        if self.profiler.frames - self.rendered_at >= self.refresh_frames or self.surface is None:
+            self.render()
+            self.rendered_at = self.profiler.frames
+        screen.blit(self.surface, topleft)
@@ -0,0 +1,201 @@
+"""
+Reachability analysis for generated levels.
+
+`JumpEnvelope` models how far Kitty can travel in one jump, from her
+movement constants (see sprites.Kitty), the breeze and platform sway. Platforms are (x, y, width, height) tuples as produced by
+level_utils; the checks look at the platforms' rest positions.
+
+`is_solvable` searches the jump graph from the ground to the final
+platform. `repair_platforms` walks a generated ladder bottom-up and fixes
+any platform Kitty could not reach, so levels can be checked inline when
+they are generated.
+"""
+from collections import deque
+
+from constants import *
+
+
+class JumpEnvelope:
+    """
+    Kitty's one-jump envelope: the highest she can land above her takeoff
+    point, and for every height difference the widest horizontal gap she
+    can clear.
+
+    Her vertical motion does not depend on anything but time, so one full
+    jump is simulated at 60 Hz up front and turned into lookup tables; a
+    reach check is then a couple of comparisons.
+    """
+
+    def __init__(self, speed=5, gravity=0.5, upward_acceleration=-1, max_jump_duration=0.5,
+                 width=100, headwind=0.0, max_breeze=6.5, wind_factor=0.3, margin=4,
+                 max_drop=2 * SCREEN_HEIGHT):
+        self.width = width
+        self.max_drop = max_drop
+
+        # Rise: accelerate upward until the jump times out, then fall from rest.
+        # Offsets are of Kitty's bottom from takeoff, negative is up.
+        ascend_frames = int(max_jump_duration * FPS)
+        velocity = offset = 0.0
+        for _ in range(ascend_frames):
+            velocity += upward_acceleration
+            offset += velocity
+        apex = offset
+        frames = ascend_frames + 1  # The frame the jump ends still counts as airborne
+        velocity = 0.0
+        descent = []  # (offset, frames in the air) while coming down
+        while offset <= max_drop:
+            velocity += gravity
+            offset += velocity
+            frames += 1
+            descent.append((offset, frames))
+
+        self.max_rise = int(-apex) - margin
+
+        # The breeze pushes Kitty only while the jump lasts, by breeze *
+        # wind_factor per frame (rounded to whole pixels by the rect).
+        # `headwind` is the breeze she must still clear a gap against; the
+        # default assumes she waits for a lull, as the breeze cycles through
+        # zero every few seconds. Platforms sway by up to max_breeze either way.
+        wind = round(headwind * wind_factor)
+        wind_frames = ascend_frames + 1
+        sway = 2 * int(max_breeze + 0.5)
+
+        # reach[h + max_drop]: widest gap when landing h pixels above takeoff
+        self.reach = []
+        i = 0
+        for h in range(self.max_rise, -max_drop - 1, -1):
+            # First descending frame at or below the landing height
+            while i < len(descent) - 1 and descent[i][0] + margin < -h:
+                i += 1
+            air = descent[i][1]
+            self.reach.append(speed * air - wind * min(air, wind_frames) - sway)
+        self.reach.reverse()
+
+    _shared = {}
+
+    @classmethod
+    def for_kitty(cls, kitty, **kwargs):
+        """
+        Envelope for a `sprites.Kitty`'s current movement settings. Envelopes
+        never change once built, so one is shared per set of settings.
+        """
+        settings = dict(speed=kitty.speed, gravity=kitty.gravity,
+                        upward_acceleration=kitty.upward_acceleration,
+                        max_jump_duration=kitty.max_jump_duration,
+                        width=kitty.rect.width, **kwargs)
+        key = tuple(sorted(settings.items()))
+        envelope = cls._shared.get(key)
+        if envelope is None:
+            envelope = cls._shared[key] = cls(**settings)
+        return envelope
+
+    def can_reach(self, src, dst):
+        """Can Kitty standing on platform `src` jump onto platform `dst`?"""
+        sx, sy, sw, _ = src
+        dx, dy, dw, _ = dst
+        h = sy - dy  # Height of dst's top above src's top
+        if h > self.max_rise:
+            return False
+        # Kitty stands on src while any column of her overlaps it, and lands
+        # on dst as soon as one column does
+        gap = max(dx - (sx + sw), sx - (dx + dw)) - self.width + 2
+        if gap <= 0:
+            return True
+        return gap <= self.reach[max(h, -self.max_drop) + self.max_drop]
+
+
+_default_envelope = None
+
+
+def default_envelope():
+    """Envelope for Kitty's stock movement settings, built on first use."""
+    global _default_envelope
+    if _default_envelope is None:
+        _default_envelope = JumpEnvelope()
+    return _default_envelope
+
+
+def reachable_platforms(platforms, start, envelope=None):
+    """Indices of `platforms` Kitty can get to from `start` (breadth first)."""
+    envelope = envelope or default_envelope()
+    nodes = [start] + list(platforms)
+    seen = {0}
+    frontier = deque([0])
+    while frontier:
+        src = nodes[frontier.popleft()]
+        for j, dst in enumerate(nodes):
+            if j not in seen and envelope.can_reach(src, dst):
+                seen.add(j)
+                frontier.append(j)
+    return sorted(j - 1 for j in seen if j)
+
+
+def is_solvable(platforms, start, final=None, envelope=None):
+    """Can Kitty get from `start` to `final` (default: the last platform)?"""
+    final_index = len(platforms) - 1 if final is None else list(platforms).index(final)
+    return final_index in reachable_platforms(platforms, start, envelope)
+
+
+def _repair(envelope, anchor, platform, screen_width):
+    # Move the platform to the anchor's side of the screen, then lower it
+    # to the highest reachable height if it is still out of reach.
+    ax, ay, aw, _ = anchor
+    x, y, w, h = platform
+    if not envelope.can_reach(anchor, (x, y, w, h)):
+        x = 0 if ax + aw / 2 < screen_width / 2 else screen_width - w
+    if not envelope.can_reach(anchor, (x, y, w, h)):
+        y = max(y, ay - envelope.max_rise)
+    return (x, y, w, h)
+
+
+def _reached_from(envelope, below, platform):
+    top = platform[1]
+    for src in reversed(below):
+        if src[1] - top > envelope.max_rise:
+            return False  # Lower ones are out of reach too
+        if envelope.can_reach(src, platform):
+            return True
+    return False
+
+
+def repair_platforms(platforms, start, envelope=None, screen_width=SCREEN_WIDTH):
+    """
+    Make a bottom-up ladder of platforms reachable from `start`.
+
+    Each platform must be reachable from `start` or a platform below it;
+    one that is not is moved to the side of the highest platform below it,
+    or lowered, and everything above it is lowered by the same amount so
+    the rest of the layout keeps its gaps.
+    Returns (platforms, repairs, shift) where `shift` is how far the top
+    platform was lowered.
+    """
+    envelope = envelope or default_envelope()
+    below = [start]  # Reachable so far, lowest first
+    result = []
+    repairs = 0
+    shift = 0
+    for x, y, w, h in platforms:
+        platform = (x, y + shift, w, h)
+        if not _reached_from(envelope, below, platform):
+            repaired = _repair(envelope, below[-1], platform, screen_width)
+            shift += repaired[1] - platform[1]
+            platform = repaired
+            repairs += 1
+        below.append(platform)
+        result.append(platform)
+    return result, repairs, shift
+
+
+def reachable_stream(chunks, start, envelope=None, screen_width=SCREEN_WIDTH):
+    """
+    Wrap a `level_utils.stream_platforms` generator so every chunk is
+    repaired against the top of the one before it.
+    """
+    anchor = start
+    shift = 0
+    for level, chunk in chunks:
+        chunk = [(x, y + shift, w, h) for x, y, w, h in chunk]
+        chunk, _, moved = repair_platforms(chunk, anchor, envelope, screen_width)
+        shift += moved
+        anchor = chunk[-1]
+        yield level, chunk
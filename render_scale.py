@@ -0,0 +1,119 @@
+import numpy as np
+import pygame
+from hud import SurfaceCache
+
+
+def scale_arg(text):
+    """argparse type for --render-scale: 0 < scale <= 1."""
+    import argparse
+
+    scale = float(text)
+    if not 0 < scale <= 1:
+        raise argparse.ArgumentTypeError(f"render scale must be above 0 and at most 1, not {text}")
+    return scale
+
+
+class ScaledCanvas:
+    """
+    An offscreen framebuffer at `scale` times the window's resolution that
+    the scene is drawn into, then stretched to the window once per frame
+    with `present`. Cuts fill rate roughly by scale squared.
+
+    It takes the same `blit`/`blits`/`fill` calls as the window surface, in
+    window coordinates, and reports the window's size, so drawing code
+    doesn't need to know about it. Images are scaled down on first use and
+    kept, keyed by the source surface.
+    """
+
+    def __init__(self, size, scale, smooth=True, max_images=8192):
+        self.size = size
+        self.scale = scale
+        self.surface = pygame.Surface((max(1, round(size[0] * scale)), max(1, round(size[1] * scale))))
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+        self.smooth = smooth
+        # Leaf frames alone are a few thousand small surfaces
+        self.images = SurfaceCache(max_images)
+        self._arrays = {}
+
+    def get_size(self):
+        return self.size
+
+    def get_width(self):
+        return self.size[0]
+
+    def get_height(self):
+        return self.size[1]
+
+    def image(self, image):
+        """`image` at the canvas's scale, built once."""
+        return self.images.get(image, lambda: self._scale_image(image))
+
+    def _scale_image(self, image):
+        width, height = image.get_size()
+        size = (max(1, round(width * self.scale)), max(1, round(height * self.scale)))
+        scale = pygame.transform.smoothscale if self.smooth and image.get_bitsize() >= 24 else pygame.transform.scale
+        return scale(image, size)
+
+    def _image_array(self, images):
+        # Scaled copy of an object array of images, kept while the caller
+        # keeps reusing the same array
+        scaled = self._arrays.get(id(images))
+        if scaled is None or scaled[0] is not images:
+            array = np.empty(len(images), dtype=object)
+            array[:] = [self._scale_image(image) for image in images]
+            scaled = self._arrays[id(images)] = (images, array)
+        return scaled[1]
+
+    def _point(self, pos):
+        scale = self.scale
+        return round(pos[0] * scale), round(pos[1] * scale)
+
+    def blit(self, image, pos, area=None):
+        if area is None:
+            return self.surface.blit(self.image(image), self._point(pos))
+        # Scale the area's edges rather than its size so bands drawn side
+        # by side (background wrapping) still meet exactly
+        x, y, width, height = area
+        left, top = self._point((x, y))
+        right, bottom = self._point((x + width, y + height))
+        return self.surface.blit(self.image(image), self._point(pos), (left, top, right - left, bottom - top))
+
+    def blits(self, blit_sequence, doreturn=True):
+        image, point = self.image, self._point
+        return self.surface.blits(((image(source), point(dest)) for source, dest in blit_sequence),
+                                  doreturn=doreturn)
+
+    def blit_array(self, images, indices, topleft):
+        """
+        Draw `images[indices]` at `topleft` (an N x 2 array, window
+        coordinates) in one `blits` call. `images` is a NumPy object array
+        reused from frame to frame (a sprite atlas); it is scaled once as a
+        whole, so there is no per-image lookup.
+        """
+        frames = self._image_array(images)[indices]
+        points = np.rint(topleft * self.scale).astype(np.int32)
+        self.surface.blits(zip(frames.tolist(), points.tolist()), doreturn=False)
+
+    def fill(self, color, rect=None):
+        if rect is None:
+            return self.surface.fill(color)
+        x, y, width, height = rect
+        left, top = self._point((x, y))
+        right, bottom = self._point((x + width, y + height))
+        return self.surface.fill(color, (left, top, right - left, bottom - top))
+
+    def present(self, screen):
+        """Stretch the frame onto `screen`."""
+        pygame.transform.scale(self.surface, screen.get_size(), screen)
+
+
+def blit_array(surface, images, indices, topleft):
+    """
+    `ScaledCanvas.blit_array` for any target: a ScaledCanvas uses its
+    pre-scaled copy of `images`, a plain Surface gets one `blits` call.
+    """
+    if isinstance(surface, ScaledCanvas):
+        surface.blit_array(images, indices, topleft)
+    else:
+        surface.blits(zip(images[indices].tolist(), topleft.tolist()), doreturn=False)
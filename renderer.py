@@ -0,0 +1,73 @@
+import pygame
+from profiler import NULL_PROFILER
+
+
+class Layer:
+    """
+    One pass of the frame, drawn back to front by a Renderer. `phase`, if
+    set, is the profiler phase marked once the layer is drawn; layers
+    without one are counted in the next marked phase.
+    """
+
+    def __init__(self, name, phase=None):
+        self.name = name
+        self.phase = phase
+
+    def draw(self, surface, camera):
+        raise NotImplementedError
+
+
+class DrawLayer(Layer):
+    """A layer that draws itself, e.g. the background or the leaf field:
+    `draw(surface, camera)` is called as is."""
+
+    def __init__(self, name, draw, phase=None):
+        super().__init__(name, phase)
+        self.draw = draw
+
+
+class SpriteLayer(Layer):
+    """
+    Sprites in world coordinates. `visible(view_rect)` returns the sprites
+    overlapping the visible area of the world (grown by `margin` above and
+    below), typically a SpatialGrid query, so the cost follows what is on
+    screen rather than how many sprites the level holds. They go to the
+    surface in one `blits` call.
+    """
+
+    def __init__(self, name, visible, margin=0, phase=None):
+        super().__init__(name, phase)
+        self.visible = visible
+        self.margin = margin
+        self.count = 0  # Sprites drawn last frame
+
+    def draw(self, surface, camera):
+        offset = int(camera.offset)
+        view = pygame.Rect(0, -offset - self.margin, camera.width, camera.height + 2 * self.margin)
+        batch = [(sprite.image, (sprite.rect.x, sprite.rect.y + offset)) for sprite in self.visible(view)]
+        self.count = len(batch)
+        if batch:
+            surface.blits(batch, doreturn=False)
+
+
+class Renderer:
+    """The scene as an ordered stack of layers."""
+
+    def __init__(self, layers=()):
+        self.layers = list(layers)
+
+    def add(self, layer):
+        self.layers.append(layer)
+        return layer
+
+    def layer(self, name):
+        for layer in self.layers:
+            if layer.name == name:
+                return layer
+        raise KeyError(name)
+
+    def draw(self, surface, camera, profiler=NULL_PROFILER):
+        for layer in self.layers:
+            layer.draw(surface, camera)
+            if layer.phase:
+                profiler.mark(layer.phase)
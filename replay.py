@@ -0,0 +1,172 @@
+"""
+Input recording and headless replay.
+
+A recording is the World's seed and start settings (including the level
+pack played, by path and content hash) plus one byte of input per
+simulation step, with a state hash every `checkpoint_interval` steps.
+Replaying it through a fresh World reproduces the session exactly, which
+makes bug reports reproducible and gives realistic performance workloads:
+
+    python replay.py session.krec
+    python replay.py session.krec --levels moved/levels.klp
+"""
+import struct
+import time
+import zlib
+from array import array
+
+from constants import *
+from level_pack import LevelPack
+from world import World, Inputs
+
+MAGIC = b"KREC"
+VERSION = 2
+# magic, version, seed, level, difficulty, endless, steps, checkpoint interval,
+# checkpoints, level pack digest (0: none), level pack path length; the path
+# (UTF-8) follows
+HEADER = struct.Struct("<4sHQhhBIHIQH")
+
+# Input bits, one byte per step
+LEFT, RIGHT, JUMP, RELEASE, RESTART = 1, 2, 4, 8, 16
+
+
+def pack_inputs(inputs):
+    return ((LEFT if inputs.left else 0) | (RIGHT if inputs.right else 0) |
+            (JUMP if inputs.jump else 0) | (RELEASE if inputs.release else 0) |
+            (RESTART if inputs.restart else 0))
+
+
+def unpack_inputs(bits):
+    return Inputs(bool(bits & LEFT), bool(bits & RIGHT), bool(bits & JUMP),
+                  bool(bits & RELEASE), bool(bits & RESTART))
+
+
+class Recording:
+    def __init__(self, seed, level, difficulty, endless=False, checkpoint_interval=60,
+                 pack_path=None, pack_digest=0):
+        self.seed = seed
+        self.level = level
+        self.difficulty = difficulty
+        self.endless = endless
+        self.checkpoint_interval = checkpoint_interval
+        self.pack_path = pack_path
+        self.pack_digest = pack_digest
+        self.inputs = bytearray()
+        self.hashes = array("Q")
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def save(self, path):
+        data = zlib.compress(bytes(self.inputs), 9)
+        pack_path = (self.pack_path or "").encode()
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.seed, self.level, self.difficulty,
+                                self.endless, len(self.inputs), self.checkpoint_interval,
+                                len(self.hashes), self.pack_digest, len(pack_path)))
+            f.write(pack_path)
+            f.write(self.hashes.tobytes())
+            f.write(data)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            blob = f.read()
+        (magic, version, seed, level, difficulty, endless, steps,
+         interval, checkpoints, pack_digest, pack_path_length) = HEADER.unpack_from(blob)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} Kitty recording")
+        offset = HEADER.size
+        pack_path = blob[offset:offset + pack_path_length].decode() or None
+        offset += pack_path_length
+        recording = cls(seed, level, difficulty, bool(endless), interval, pack_path, pack_digest)
+        recording.hashes.frombytes(blob[offset:offset + 8 * checkpoints])
+        recording.inputs = bytearray(zlib.decompress(blob[offset + 8 * checkpoints:]))
+        if len(recording.inputs) != steps:
+            raise ValueError(f"{path} is truncated")
+        return recording
+
+
+class Recorder:
+    """Captures a World session. Create it before the first step."""
+
+    def __init__(self, world, checkpoint_interval=60):
+        pack = world.level_pack
+        self.recording = Recording(world.seed, world.current_level, world.current_difficulty,
+                                   world.endless, checkpoint_interval,
+                                   pack.path if pack else None, pack.digest() if pack else 0)
+
+    def record(self, inputs, world):
+        """Call after each `world.step(inputs)`."""
+        recording = self.recording
+        recording.inputs.append(pack_inputs(inputs))
+        if len(recording.inputs) % recording.checkpoint_interval == 0:
+            recording.hashes.append(world.state_hash())
+
+    def save(self, path):
+        self.recording.save(path)
+
+
+def open_level_pack(recording, path=None):
+    """
+    The level pack `recording` was played on, from `path` or else the path
+    it was recorded with, or None if it used generated levels. Raises
+    ValueError if the pack's contents changed.
+    """
+    if not recording.pack_digest:
+        return None
+    path = path or recording.pack_path
+    if path is None:
+        raise ValueError("recording was played on a level pack but has no path for it")
+    pack = LevelPack.open(path)
+    if pack.digest() != recording.pack_digest:
+        pack.close()
+        raise ValueError(f"{path} is not the level pack the recording was played on")
+    return pack
+
+
+def replay(recording, verify=True, level_pack=None):
+    """
+    Re-run a recording headless as fast as possible. Recordings made on a
+    level pack reopen it (see `open_level_pack`) unless `level_pack` is given.
+    Returns (world, steps per second, first diverging step or None).
+    """
+    if level_pack is None:
+        level_pack = open_level_pack(recording)
+    world = World(level=recording.level, difficulty=recording.difficulty,
+                  endless=recording.endless, seed=recording.seed, max_leaves=0,
+                  level_pack=level_pack)
+    interval = recording.checkpoint_interval
+    hashes = recording.hashes
+    decoded = [unpack_inputs(bits) for bits in range(32)]
+    diverged = None
+
+    start = time.perf_counter()
+    for step, bits in enumerate(recording.inputs, 1):
+        world.step(decoded[bits], FIXED_DT)
+        if verify and step % interval == 0 and diverged is None:
+            if world.state_hash() != hashes[step // interval - 1]:
+                diverged = step
+    elapsed = time.perf_counter() - start
+    return world, len(recording.inputs) / max(elapsed, 1e-9), diverged
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Replay a Kitty recording headless.")
+    parser.add_argument("recording")
+    parser.add_argument("--no-verify", action="store_true", help="skip state hash checks")
+    parser.add_argument("--levels", metavar="PATH", help="level pack the recording was played on, if moved")
+    args = parser.parse_args()
+
+    recording = Recording.load(args.recording)
+    world, speed, diverged = replay(recording, verify=not args.no_verify,
+                                    level_pack=open_level_pack(recording, args.levels))
+    print(f"{len(recording)} steps, seed {recording.seed}, {speed:.0f} steps/s, "
+          f"state {world.state_hash():016x}")
+    if diverged is not None:
+        print(f"DIVERGED at step {diverged}")
+        raise SystemExit(1)
+    if not args.no_verify:
+        print(f"{len(recording.hashes)} checkpoints match")
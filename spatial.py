@@ -0,0 +1,84 @@
+class SpatialGrid:
+    """
+    Broadphase index of sprites bucketed into horizontal rows of world y.
+
+    The level is a tall, narrow column, so rows alone are enough: a query
+    only looks at the few rows its rect spans, whatever the total number of
+    sprites. Moving sprites call `update()`, which only touches the buckets
+    when the sprite crosses a row boundary.
+    """
+
+    def __init__(self, cell_size=200):
+        self.cell_size = cell_size
+        self.rows = {}   # row index -> list of sprites overlapping that row
+        self.spans = {}  # sprite -> (first row, last row)
+
+    def __len__(self):
+        return len(self.spans)
+
+    def __contains__(self, sprite):
+        return sprite in self.spans
+
+    def _span(self, rect):
+        return rect.top // self.cell_size, (rect.bottom - 1) // self.cell_size
+
+    def clear(self):
+        self.rows.clear()
+        self.spans.clear()
+
+    def insert(self, sprite):
+        span = self._span(sprite.rect)
+        self.spans[sprite] = span
+        rows = self.rows
+        for row in range(span[0], span[1] + 1):
+            bucket = rows.get(row)
+            if bucket is None:
+                rows[row] = [sprite]
+            else:
+                bucket.append(sprite)
+
+    def remove(self, sprite):
+        span = self.spans.pop(sprite, None)
+        if span is None:
+            return
+        rows = self.rows
+        for row in range(span[0], span[1] + 1):
+            bucket = rows[row]
+            bucket.remove(sprite)
+            if not bucket:
+                del rows[row]
+
+    def update(self, sprite):
+        """Re-bucket `sprite` after its rect moved."""
+        if self.spans.get(sprite) != self._span(sprite.rect):
+            self.remove(sprite)
+            self.insert(sprite)
+
+    def query_rect(self, rect):
+        """Sprites whose rect overlaps `rect`."""
+        first, last = self._span(rect)
+        rows = self.rows
+        spans = self.spans
+        hits = []
+        for row in range(first, last + 1):
+            bucket = rows.get(row)
+            if not bucket:
+                continue
+            for sprite in bucket:
+                # A sprite spanning several rows is only reported from the
+                # first row both it and the query cover
+                if max(spans[sprite][0], first) == row and rect.colliderect(sprite.rect):
+                    hits.append(sprite)
+        return hits
+
+    def any_rect(self, rect):
+        """First sprite overlapping `rect`, or None."""
+        first, last = self._span(rect)
+        rows = self.rows
+        for row in range(first, last + 1):
+            bucket = rows.get(row)
+            if bucket:
+                for sprite in bucket:
+                    if rect.colliderect(sprite.rect):
+                        return sprite
+        return None
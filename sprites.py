@@ -1,25 +1,83 @@
 import random
 import math
+from functools import lru_cache
 import pygame
 from constants import *
+from assets import assets
+
+LEAF_ANGLE_FRAMES = 360 // LEAF_ANGLE_STEP
+
+KITTY_IMAGE = 'assets/kitty.png'
+DOG_IMAGE = 'assets/Fierce_Dog.png'
+EAGLE_IMAGE = 'assets/Flying_Eagle.png'
+
+def kitty_image(flip_x=False):
+    return assets.image(KITTY_IMAGE, (100, 100), flip_x=flip_x, fallback=(0, 0, 0, 0))
+
+def dog_image(flip_x=False):
+    return assets.image(DOG_IMAGE, (100, 60), flip_x=flip_x, smooth=True, fallback=(120, 20, 20))
+
+def eagle_image(flip_x=False):
+    return assets.image(EAGLE_IMAGE, (120, 80), flip_x=flip_x, smooth=True, fallback=(100, 100, 0))  # Placeholder color
+
+def preload_images():
+    """Load and scale every sprite image so spawning never hits the disk."""
+    kitty_image()
+    kitty_image(flip_x=True)
+    Dog.load_frames()
+    Eagle.load_frames()
+
+@lru_cache(maxsize=PLATFORM_TEXTURE_CACHE_SIZE)
+def platform_texture(image, width, height):
+    """`image` scaled to (width, height), shared by every platform of that size."""
+    return pygame.transform.scale(image, (width, height))
+
+def prerender_platform_textures(image, widths=range(30, 201), height=20):
+    """
+    Scale the branch for every width the level generator can produce (plus
+    the ground) so building or restarting a level does no scaling at all.
+    """
+    for width in widths:
+        platform_texture(image, width, height)
+    platform_texture(image, SCREEN_WIDTH, 10)  # Ground
+
+# Facing indices into an enemy's `frames` table
+FACING_RIGHT = 0
+FACING_LEFT = 1
+
+@lru_cache(maxsize=None)
+def leaf_image(size, color):
+    """Unrotated leaf surface; one per (size, color)."""
+    image = pygame.Surface((size, size), pygame.SRCALPHA)
+    # Draw a leaf shape
+    points = [
+        (size//2, 0),  # top
+        (size, size//2),  # right
+        (size//2, size),  # bottom
+        (0, size//2),  # left
+    ]
+    pygame.draw.polygon(image, color, points)
+    return image
+
+@lru_cache(maxsize=LEAF_FRAME_CACHE_SIZE)
+def leaf_frame(size, color, angle_index):
+    """Leaf surface pre-rotated to `angle_index * LEAF_ANGLE_STEP` degrees."""
+    return pygame.transform.rotate(leaf_image(size, color), angle_index * LEAF_ANGLE_STEP)
+
+def prerender_leaf_frames(sizes=range(5, 16), colors=FALL_COLORS):
+    """Fill the leaf frame cache up front so no rotation happens mid-game."""
+    for size in sizes:
+        for color in colors:
+            for angle_index in range(LEAF_ANGLE_FRAMES):
+                leaf_frame(size, color, angle_index)
 
 class Leaf(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
-        # Create a leaf surface
         self.size = random.randint(5, 15)
-        self.original_image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        
-        # Draw a leaf shape
-        color = random.choice(FALL_COLORS)
-        points = [
-            (self.size//2, 0),  # top
-            (self.size, self.size//2),  # right
-            (self.size//2, self.size),  # bottom
-            (0, self.size//2),  # left
-        ]
-        pygame.draw.polygon(self.original_image, color, points)
-        
+        self.color = random.choice(FALL_COLORS)
+        self.original_image = leaf_image(self.size, self.color)
+
         self.image = self.original_image
         self.rect = self.image.get_rect(center=(x, y))
         
@@ -47,11 +105,12 @@ class Leaf(pygame.sprite.Sprite):
         
         # Rotate leaf
         self.angle += (self.rotation_speed + breeze_strength * 0.5) * dt * 60
-        self.image = pygame.transform.rotate(self.original_image, self.angle)
+        # Pick the nearest pre-rotated frame instead of rotating every frame
+        angle_index = int(round(self.angle / LEAF_ANGLE_STEP)) % LEAF_ANGLE_FRAMES
+        self.image = leaf_frame(self.size, self.color, angle_index)
         
         # Update rect position
-        old_center = self.rect.center
-        self.rect = self.image.get_rect()
+        self.rect.size = self.image.get_size()
         self.rect.center = (self.x, self.y)
         
         # Reset if leaf goes off screen
@@ -69,41 +128,42 @@ class Leaf(pygame.sprite.Sprite):
         self.fall_speed = random.uniform(1, 2)
 
 class Platform(pygame.sprite.Sprite):
-    def __init__(self, platform_data, image):
+    """
+    A swaying branch. Its kinematics (original_x, base_y, phase,
+    offset_phase) are initial values: World moves platforms all at once
+    through platform_motion.PlatformMotion.
+    """
+
+    def __init__(self, platform_data, image, rng=random):
         super().__init__()
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(platform_data, image, rng)
+
+    def reset(self, platform_data, image, rng=random):
+        """(Re)initialise in place; used by __init__ and the sprite pool."""
         x, y, width, height = platform_data
-        self.image = pygame.transform.scale(image, (width, height))
-        self.rect = self.image.get_rect(topleft=(x, y))
+        self.image = platform_texture(image, width, height)
+        self.rect.update(x, y, width, height)
         self.original_x = x
         self.base_y = y  
-        self.phase = random.uniform(0, 2 * math.pi)  # For vertical oscillation timing.
-        self.offset_phase = random.uniform(0, 2 * math.pi)  # For horizontal sway offset.
-        self.prev_rect = self.rect.copy()
+        self.phase = rng.uniform(0, 2 * math.pi)  # For vertical oscillation timing.
+        self.offset_phase = rng.uniform(0, 2 * math.pi)  # For horizontal sway offset.
         
-        # Optional attribute for final platform, set by level generator
+        # Optional attributes set by the level generator / world
         self.is_final = False
-
-    def update(self, breeze_strength, time_elapsed):
-        # Save previous position for potential use in carrying Kitty.
-        self.prev_rect = self.rect.copy()
-
-        # Horizontal sway: Use breeze_strength and time_elapsed.
-        sway_offset = breeze_strength * math.sin(time_elapsed + self.offset_phase)
-        self.rect.x = self.original_x + sway_offset
-
-        # Vertical undulation: Skip if this is the ground platform.
-        if not getattr(self, "is_ground", False):
-            self.phase += 0.05  # Fixed increment for undulation timing.
-            undulation_offset = breeze_strength * math.sin(self.phase)
-            self.rect.y = self.base_y + undulation_offset
+        self.is_ground = False
+        self.spawn_index = None
+        self.level = 0  # Endless mode: the level chunk it was streamed for
 
 class Kitty(pygame.sprite.Sprite):
     def __init__(self, meow_sounds):
         super().__init__()
-        img = pygame.image.load('assets/kitty.png').convert_alpha()
-        self.original_image = pygame.transform.scale(img, (100, 100))
-        self.flipped_image = pygame.transform.flip(self.original_image, True, False)
+        self.original_image = kitty_image()
+        self.flipped_image = kitty_image(flip_x=True)
+        self.original_mask = assets.mask(self.original_image)
+        self.flipped_mask = assets.mask(self.flipped_image)
         self.image = self.original_image
+        self.mask = self.original_mask
         self.rect = self.image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
         self.speed = 5
         self.jump = False
@@ -120,33 +180,39 @@ class Kitty(pygame.sprite.Sprite):
     def check_falling(self, platforms):
         # Move Kitty 1 pixel down temporarily to check for a platform underneath
         self.rect.y += 1
-        if not pygame.sprite.spritecollideany(self, platforms):
+        if platforms.any_rect(self.rect) is None:
             if not self.falling:
                 self.falling = True
                 self.velocity = 0
         self.rect.y -= 1
 
-    def update(self, pressed_keys, platforms, breeze_strength):
+    def update(self, pressed_keys, platforms, breeze_strength, now, dt=FIXED_DT):
+        # `platforms` is the level's platform index (spatial.SpatialGrid) and
+        # `now` the simulation time in milliseconds (see World.step).
+        # Speeds are tuned per 60 Hz frame; `step` rescales them for other dt.
+        step = dt * FPS
         self.previous_rect = self.rect.copy()
 
         # Move left/right with arrow keys
         if pressed_keys[pygame.K_LEFT]:
-            self.rect.x -= self.speed
+            self.rect.x -= self.speed * step
         if pressed_keys[pygame.K_RIGHT]:
-            self.rect.x += self.speed
+            self.rect.x += self.speed * step
 
         # Flip sprite based on horizontal movement direction
         dx = self.rect.x - self.previous_rect.x
         if dx > 0:
             # moving right
             self.image = self.original_image
+            self.mask = self.original_mask
         elif dx < 0:
             # moving left
             self.image = self.flipped_image
+            self.mask = self.flipped_mask
 
         # Apply wind push only while Kitty is jumping (breeze strength affects this)
         if self.jump:
-            self.rect.x += breeze_strength * 0.3  # Scaled down to avoid excessive push
+            self.rect.x += breeze_strength * 0.3 * step  # Scaled down to avoid excessive push
 
         # Keep Kitty inside screen bounds
         if self.rect.left < 0:
@@ -157,25 +223,26 @@ class Kitty(pygame.sprite.Sprite):
         # Jumping and gravity logic remains the same
             # Jump/fall logic
         if self.jump:
-            jump_time = (pygame.time.get_ticks() - self.jump_start_time) / 1000.0
+            jump_time = (now - self.jump_start_time) / 1000.0
             if jump_time < self.max_jump_duration:
-                self.velocity += self.upward_acceleration
+                self.velocity += self.upward_acceleration * step
             else:
                 self.falling = True
                 self.jump = False
                 self.velocity = 0
         if self.falling:
-            self.velocity += self.gravity
-        self.rect.y += self.velocity
+            self.velocity += self.gravity * step
+        self.rect.y += self.velocity * step
         if not self.jump:
             self.check_falling(platforms)
 
-    def do_jump(self):
+    def do_jump(self, now):
         if not self.jump and not self.falling:
             self.jump = True
-            self.jump_start_time = pygame.time.get_ticks()
-            self.meow_sounds[self.meow_index].play()
-            self.meow_index = (self.meow_index + 1) % len(self.meow_sounds)
+            self.jump_start_time = now
+            if self.meow_sounds:
+                self.meow_sounds[self.meow_index].play()
+                self.meow_index = (self.meow_index + 1) % len(self.meow_sounds)
 
     def stop_jump(self):
         if self.jump:
@@ -184,26 +251,40 @@ class Kitty(pygame.sprite.Sprite):
             self.jump = False
 
 class Dog(pygame.sprite.Sprite):
-    def __init__(self, platform):
+    # frames[facing][animation frame], built once and shared by every dog,
+    # with a collision mask per frame in masks
+    frames = None
+    masks = None
+
+    @classmethod
+    def load_frames(cls):
+        if cls.frames is None:
+            # The dog art faces right
+            cls.frames = (
+                (dog_image(),),
+                (dog_image(flip_x=True),),
+            )
+            cls.masks = tuple(tuple(assets.mask(frame) for frame in row) for row in cls.frames)
+        return cls.frames
+
+    def __init__(self, platform, rng=random):
         super().__init__()
-        try:
-            img = pygame.image.load('assets/Fierce_Dog.png').convert_alpha()
-            self.original_image = pygame.transform.smoothscale(img, (100, 60))
-        except Exception:
-            self.original_image = pygame.Surface((100, 60), pygame.SRCALPHA)
-            self.original_image.fill((120, 20, 20))
-        self.image = self.original_image
+        self.frames = self.load_frames()
+        self.original_image = self.frames[FACING_RIGHT][0]
+        self.rect = self.original_image.get_rect()
+        self.reset(platform, rng)
+
+    def reset(self, platform, rng=random):
+        """(Re)initialise in place; used by __init__ and the sprite pool."""
+        self.anim_frame = 0
         self.platform = platform
         self.offset_x = max(10, min(platform.rect.width - 20, platform.rect.width // 2))
-        self.rect = self.image.get_rect()
         self.rect.midbottom = (platform.rect.left + self.offset_x, platform.rect.top)
-        self.speed = random.uniform(20, 45) 
-        self.direction = random.choice([-1, 1])
-
-        if self.direction < 0:
-            self.image = pygame.transform.flip(self.original_image, True, False)
-        else:
-            self.image = self.original_image
+        self.speed = rng.uniform(20, 45) 
+        self.direction = rng.choice([-1, 1])
+        facing = FACING_LEFT if self.direction < 0 else FACING_RIGHT
+        self.image = self.frames[facing][self.anim_frame]
+        self.mask = self.masks[facing][self.anim_frame]
 
     def update(self, dt):
         self.offset_x += self.direction * self.speed * dt
@@ -215,37 +296,51 @@ class Dog(pygame.sprite.Sprite):
             self.direction *= -1
 
         self.rect.midbottom = (self.platform.rect.left + int(self.offset_x), self.platform.rect.top)
-
-        if self.direction < 0:
-            self.image = pygame.transform.flip(self.original_image, True, False)
-        else:
-            self.image = self.original_image
+        facing = FACING_LEFT if self.direction < 0 else FACING_RIGHT
+        self.image = self.frames[facing][self.anim_frame]
+        self.mask = self.masks[facing][self.anim_frame]
 
 class Eagle(pygame.sprite.Sprite):
-    def __init__(self, kitty):
+    # frames[facing][animation frame], built once and shared by every eagle,
+    # with a collision mask per frame in masks
+    frames = None
+    masks = None
+
+    @classmethod
+    def load_frames(cls):
+        if cls.frames is None:
+            # The eagle art faces left
+            cls.frames = (
+                (eagle_image(flip_x=True),),
+                (eagle_image(),),
+            )
+            cls.masks = tuple(tuple(assets.mask(frame) for frame in row) for row in cls.frames)
+        return cls.frames
+
+    def __init__(self, kitty, camera_offset=0, rng=random):
         super().__init__()
-        try:
-            img = pygame.image.load('assets/Flying_Eagle.png').convert_alpha()
-            # Scale accordingly
-            self.original_image = pygame.transform.smoothscale(img, (120, 80))
-        except Exception:
-            self.original_image = pygame.Surface((120, 80), pygame.SRCALPHA)
-            self.original_image.fill((100, 100, 0)) # Placeholder color
+        self.frames = self.load_frames()
+        self.original_image = self.frames[FACING_LEFT][0]
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(kitty, camera_offset, rng)
+
+    def reset(self, kitty, camera_offset=0, rng=random):
+        """(Re)initialise in place; used by __init__ and the sprite pool."""
+        self.anim_frame = 0
 
         # Determine side to swoop in from (left or right)
-        self.side = random.choice(['left', 'right'])
+        self.side = rng.choice(['left', 'right'])
         
         # Set starting position based on side
-        start_y = random.randint(100, SCREEN_HEIGHT // 2) # Start from upper half
+        start_y = rng.randint(100, SCREEN_HEIGHT // 2) # Start from upper half
+        start_y -= int(camera_offset)  # ...of the current view, in world coordinates
+        self.rect.size = self.original_image.get_size()
         if self.side == 'left':
-            self.rect = self.original_image.get_rect(midright=(0, start_y))
-            self.velocity_x = random.randint(150, 250)
-            self.image = self.original_image 
+            self.rect.midright = (0, start_y)
+            self.velocity_x = rng.randint(150, 250)
         else:
-            self.rect = self.original_image.get_rect(midleft=(SCREEN_WIDTH, start_y))
-            self.velocity_x = random.randint(-250, -150)
-            # Flip image to face left
-            self.image = pygame.transform.flip(self.original_image, True, False)
+            self.rect.midleft = (SCREEN_WIDTH, start_y)
+            self.velocity_x = rng.randint(-250, -150)
 
         # Target kitty's current position roughly? NO, just swoop across
         # Actually, let's target kitty slightly
@@ -255,11 +350,10 @@ class Eagle(pygame.sprite.Sprite):
         # Cap vertical velocity so it doesn't dive too steep
         self.velocity_y = max(-100, min(100, self.velocity_y))
         
-        # Ensure the sprite is facing the direction of travel
-        if self.velocity_x < 0:
-            self.image = self.original_image
-        else:
-            self.image = pygame.transform.flip(self.original_image, True, False)
+        # Face the direction of travel
+        facing = FACING_LEFT if self.velocity_x < 0 else FACING_RIGHT
+        self.image = self.frames[facing][self.anim_frame]
+        self.mask = self.masks[facing][self.anim_frame]
 
     def update(self, dt):
         self.rect.x += self.velocity_x * dt
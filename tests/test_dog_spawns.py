@@ -0,0 +1,89 @@
+import random
+
+import pygame
+import pytest
+
+from dog_spawns import DogSpawnIndex
+
+GAP = 100  # World y between consecutive spawn candidates
+
+
+class FakePlatform:
+    def __init__(self, y, spawn_index=None):
+        self.rect = pygame.Rect(0, y, 100, 20)
+        if spawn_index is not None:
+            self.spawn_index = spawn_index
+
+
+def brute_force(candidates, occupied, view_top, avoid_rect, spawn_buffer):
+    # The filter World used before DogSpawnIndex
+    def allowed(p):
+        if p in occupied:
+            return False
+        if p.rect.colliderect(avoid_rect):
+            return False
+        return all(abs(p.spawn_index - o.spawn_index) > 1 for o in occupied)
+
+    return {p for p in candidates if p.rect.bottom < view_top - spawn_buffer and allowed(p)}
+
+
+def check(index, candidates, occupied, view_top, avoid_rect, rng):
+    expected = brute_force(candidates, occupied, view_top, avoid_rect, index.spawn_buffer)
+    assert {p for p in candidates if index.allows(p, view_top, avoid_rect)} == expected
+    chosen = index.choose(view_top, rng, avoid_rect)
+    if expected:
+        assert chosen in expected
+    else:
+        assert chosen is None
+    return chosen
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_choose_matches_brute_force_built_level(seed):
+    # top_first: spawn index 0 is the top platform
+    rng = random.Random(seed)
+    count = rng.randint(1, 40)
+    candidates = [FakePlatform(-(count - i) * GAP, i) for i in range(count)]
+    index = DogSpawnIndex()
+    index.reset(candidates, top_first=True)
+    occupied = []
+    view_top = 0
+    for _ in range(200):
+        view_top += rng.randint(-3 * GAP, 3 * GAP)
+        view_top = max(-(count + 5) * GAP, min(view_top, 5 * GAP))
+        kitty = pygame.Rect(0, view_top + rng.randint(-2 * GAP, 2 * GAP), 60, 60)
+        chosen = check(index, candidates, occupied, view_top, kitty, rng)
+        if chosen is not None and len(occupied) < 6 and rng.random() < 0.5:
+            index.occupy(chosen)
+            occupied.append(chosen)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_choose_matches_brute_force_endless(seed):
+    # Endless tower: platforms are added at the top (index climbs) and
+    # retired from the bottom, taking their dogs with them
+    rng = random.Random(seed)
+    index = DogSpawnIndex()
+    index.reset(top_first=False)
+    candidates = []
+    occupied = []
+    next_y = 0
+    view_top = 0
+    for _ in range(300):
+        roll = rng.random()
+        if roll < 0.3:
+            platform = FakePlatform(next_y)
+            next_y -= GAP
+            index.add(platform)
+            candidates.append(platform)
+        elif roll < 0.45 and candidates:
+            platform = candidates.pop(0)
+            occupied = [p for p in occupied if p is not platform]
+            index.remove(platform)
+        else:
+            view_top += rng.randint(-2 * GAP, 3 * GAP)
+        kitty = pygame.Rect(0, view_top + rng.randint(-2 * GAP, 2 * GAP), 60, 60)
+        chosen = check(index, candidates, occupied, view_top, kitty, rng)
+        if chosen is not None and len(occupied) < 6 and rng.random() < 0.5:
+            index.occupy(chosen)
+            occupied.append(chosen)
@@ -0,0 +1,39 @@
+from constants import *
+import level_pack
+from world import World
+
+
+def test_endless_restart_ground_starts_at_start_level():
+    # Platforms streamed for higher levels go back to the pool as the
+    # camera climbs; after a death one of them becomes the new ground
+    world = World(endless=True, level=1, seed=1, max_leaves=0)
+    for _ in range(40):
+        world.camera.offset += SCREEN_HEIGHT / 4
+        world.stream_level()
+    assert max(p.level for p in world.streamed_platforms) > 1
+
+    world.lose_life("fell")
+    assert world.current_level == 1
+    for _ in range(2 * FPS):
+        world.step()
+        if not world.kitty.falling:
+            break
+    assert not world.kitty.falling
+    assert world.current_level == 1
+
+
+def test_pack_spawn_table_repeats(tmp_path):
+    # Random spawning never stops, so a pack level's table mustn't either
+    _, _, platforms, _ = next(level_pack.generated_levels(levels=[5], difficulties=[1], variants=1))
+    path = tmp_path / "levels.klp"
+    level_pack.write_pack(path, [(5, 1, platforms, [(1000, level_pack.EAGLE, -1)])])
+    pack = level_pack.LevelPack.open(path)
+    world = World(level=5, difficulty=1, seed=1, max_leaves=0, level_pack=pack)
+    assert world.spawn_table is not None
+
+    spawns = []
+    spawn_eagle = world.spawn_eagle_logic
+    world.spawn_eagle_logic = lambda: spawns.append(world.now) or spawn_eagle()
+    for _ in range(10 * FPS):
+        world.step()
+    assert len(spawns) >= 9
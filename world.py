@@ -0,0 +1,563 @@
+import hashlib
+import random
+import time
+from collections import deque, namedtuple
+
+import numpy as np
+import pygame
+
+from constants import *
+from assets import assets
+from sprites import Kitty, Platform, Dog, Eagle, prerender_platform_textures
+from leaf_field import LeafField
+from camera import Camera
+from spatial import SpatialGrid
+from platform_motion import PlatformMotion
+from pool import SpritePool
+from dog_spawns import DogSpawnIndex
+from profiler import NULL_PROFILER
+from level_utils import get_breeze_strength, generate_platforms, setup_dog_spawn_candidates, stream_platforms
+from reachability import JumpEnvelope, repair_platforms, reachable_stream
+from level_pack import LevelPack, DOG, EAGLE, FINAL, GROUND, ANY_PLATFORM
+
+# One frame of player input. `jump` and `release` are edges (space pressed /
+# released this step), `left` and `right` are held states. `restart` starts a
+# new game (the game-over screen's R key) before the step runs.
+Inputs = namedtuple("Inputs", ["left", "right", "jump", "release", "restart"],
+                    defaults=(False,))
+NO_INPUT = Inputs(False, False, False, False)
+
+# Seeds are unsigned 64-bit: recordings store them that way and the leaf
+# field's NumPy generator needs them non-negative
+MAX_SEED = 2 ** 64
+
+
+def seed_arg(text):
+    """argparse type for --seed options."""
+    import argparse
+
+    seed = int(text)
+    if not 0 <= seed < MAX_SEED:
+        raise argparse.ArgumentTypeError(f"seed must be between 0 and 2**64 - 1, not {seed}")
+    return seed
+
+
+class World:
+    """
+    All gameplay state for one session: Kitty, the level's sprite groups,
+    camera, lives and spawn timers. Sprites are kept in world coordinates;
+    `camera` maps them to the screen.
+
+    `step()` advances the simulation by one tick and never touches the
+    display, mixer or wall clock, so the game can run headless at whatever
+    speed the CPU allows. Presentation (delays, sounds, screens) is left to
+    the caller, driven by the events `step()` returns.
+
+    All gameplay randomness comes from `self.rng`, seeded from `seed`, so the
+    same seed and the same per-step inputs always give the same game.
+    """
+
+    def __init__(self, level=1, difficulty=1, lives=3, max_levels=10,
+                 branch_image=None, meow_sounds=None, max_leaves=MAX_LEAVES,
+                 endless=False, seed=None, level_pack=None):
+        if branch_image is None:
+            branch_image = assets.image('assets/branch.png', fallback=(139, 69, 19))
+        self.branch_image = branch_image
+        prerender_platform_textures(branch_image)
+
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        elif not 0 <= seed < MAX_SEED:
+            raise ValueError(f"seed must be between 0 and 2**64 - 1, not {seed}")
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.max_levels = max_levels
+        self.current_level = level
+        self.current_difficulty = difficulty
+        self.lives = lives
+        self.max_leaves = max_leaves
+
+        # Endless tower mode: platforms are streamed in above the camera and
+        # retired below it instead of building a fixed level
+        self.endless = endless
+        self.start_level = level
+        self.platform_stream = None
+        self.streamed_platforms = deque()  # Oldest (lowest) first
+        self.stream_top = 0
+
+        self.now = 0  # Simulation clock in milliseconds
+        self.time_elapsed = 0.0
+        self.frame = 0
+
+        self.camera = Camera()
+        self.level_complete = False
+
+        # Sprite Groups
+        self.all_sprites = pygame.sprite.Group()
+        self.platforms = pygame.sprite.Group()
+        self.leaves = None  # LeafField, see initialize_leaves()
+        self.dogs = pygame.sprite.Group()
+        self.eagles = pygame.sprite.Group()
+
+        # Broadphase indexes for collision queries (world y buckets)
+        self.platform_index = SpatialGrid()
+        self.platform_motion = PlatformMotion()  # Vectorized sway/undulation
+        self.enemy_index = SpatialGrid()
+
+        # Phase timing hooks (profiler.FrameProfiler); disabled by default
+        self.profiler = NULL_PROFILER
+
+        # Released sprites are reset in place and reused across respawns,
+        # deaths and level transitions
+        self.platform_pool = SpritePool(Platform)
+        self.dog_pool = SpritePool(Dog)
+        self.eagle_pool = SpritePool(Eagle)
+
+        self.final_platform_data = None
+        self.dog_spawns = DogSpawnIndex()  # Where dogs may spawn, with occupancy
+        self.next_dog_spawn_time = 0
+        self.next_eagle_spawn_time = 0
+
+        # Levels from a level_pack.LevelPack replace generated ones where the
+        # pack has the level/difficulty, and bring their own spawn table
+        self.level_pack = level_pack
+        self.pack_platforms = []  # Platforms in pack order, for the spawn table
+        self.spawn_table = None   # SPAWN_RECORD array, None for random spawning
+        self.spawn_cursor = 0
+        self.spawn_table_offset = 0  # ms added to table times; grows as the table repeats
+        self.next_scripted_spawn = None  # ms after level_start_time
+        self.level_start_time = 0
+
+        self.kitty = Kitty(meow_sounds or [])
+        self.all_sprites.add(self.kitty)
+        # Generated levels are checked against what Kitty can jump and
+        # repaired where a platform is out of reach
+        self.jump_envelope = JumpEnvelope.for_kitty(self.kitty)
+        self.level_repairs = 0
+
+        self.restart_current_level(regenerate=True)
+        self.initialize_leaves()
+
+    # ------------------ Level setup -------------------
+
+    def create_ground(self):
+        ground = self.platform_pool.acquire(GROUND_PLATFORM, self.branch_image, self.rng)
+        ground.is_ground = True
+        return ground
+
+    def add_platform(self, platform):
+        self.platforms.add(platform)
+        self.all_sprites.add(platform)
+        self.platform_index.insert(platform)
+        self.platform_motion.add(platform)
+
+    def remove_platform(self, platform):
+        self.platform_pool.release(platform)
+        self.platform_index.remove(platform)
+        self.platform_motion.remove(platform)
+
+    def clear_level(self):
+        """Return every platform, dog and eagle to their pools."""
+        self.platform_pool.release_all(self.platforms)
+        self.dog_pool.release_all(self.dogs)
+        self.eagle_pool.release_all(self.eagles)
+        self.all_sprites.empty()
+        self.all_sprites.add(self.kitty)
+        self.platform_index.clear()
+        self.platform_motion.clear()
+        self.enemy_index.clear()
+        self.dog_spawns.reset()
+
+    def initialize_leaves(self):
+        # Leaves are cosmetic; their own generator keeps them off self.rng
+        self.leaves = LeafField(self.max_leaves, rng=np.random.default_rng(self.seed))
+
+    def restart_current_level(self, regenerate=False):
+        kitty = self.kitty
+        self.camera.reset()
+        kitty.rect.midbottom = (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50)
+        kitty.velocity = 0
+        kitty.falling = False
+        kitty.jump = False
+        self.level_complete = False
+
+        if self.endless:
+            self.restart_endless()
+        elif regenerate:
+            self.clear_level()
+            variants = self.level_pack.find(self.current_level, self.current_difficulty) if self.level_pack else ()
+            if variants:
+                self.load_packed_level(self.level_pack[variants[self.rng.randrange(len(variants))]])
+            else:
+                self.generate_level()
+
+        # Reset spawn time
+        base = DOG_SPAWN_BASE.get(self.current_difficulty, 5000)
+        self.next_dog_spawn_time = self.now + self.rng.randint(int(base * 0.5), int(base * 1.5))
+        self.next_eagle_spawn_time = self.now + self.rng.randint(*EAGLE_SPAWN_INTERVAL)
+        self.level_start_time = self.now
+        self.spawn_cursor = 0
+        self.spawn_table_offset = 0
+        if self.spawn_table is not None and len(self.spawn_table):
+            self.next_scripted_spawn = int(self.spawn_table["time"][0])
+        else:
+            self.next_scripted_spawn = None
+
+    def generate_level(self):
+        max_plats = 11 if self.current_level == 1 else 10
+        self.spawn_table = None
+
+        plat_data_list, temp_final = generate_platforms(
+            max_plats, SCREEN_WIDTH, SCREEN_HEIGHT,
+            level=self.current_level, difficulty=self.current_difficulty, rng=self.rng
+        )
+        plat_data_list, self.level_repairs, _ = repair_platforms(plat_data_list, GROUND_PLATFORM, self.jump_envelope)
+        temp_final = plat_data_list[-1]
+
+        for i, p_data in enumerate(plat_data_list):
+            new_platform = self.platform_pool.acquire(p_data, self.branch_image, self.rng)
+            if i == len(plat_data_list) - 1:
+                new_platform.is_final = True
+            self.add_platform(new_platform)
+
+        self.add_platform(self.create_ground())
+
+        self.final_platform_data = temp_final
+
+        # Recompute candidates
+        self.dog_spawns.reset(setup_dog_spawn_candidates(self.platforms.sprites(), SCREEN_HEIGHT))
+
+    def load_packed_level(self, packed):
+        """Build the level from a level_pack.PackedLevel."""
+        platforms = []
+        candidates = []
+        has_ground = False
+        for x, y, width, height, flags, spawn_index in packed.platforms.tolist():
+            platform = self.platform_pool.acquire((x, y, width, height), self.branch_image, self.rng)
+            platform.is_final = bool(flags & FINAL)
+            platform.is_ground = bool(flags & GROUND)
+            has_ground = has_ground or platform.is_ground
+            if platform.is_final:
+                self.final_platform_data = (x, y, width, height)
+            if spawn_index >= 0:
+                platform.spawn_index = spawn_index
+                candidates.append(platform)
+            self.add_platform(platform)
+            platforms.append(platform)
+        if not has_ground:
+            self.add_platform(self.create_ground())
+
+        self.pack_platforms = platforms
+        self.dog_spawns.reset(candidates)
+        self.spawn_table = packed.spawns
+        self.level_repairs = 0
+
+    def restart_endless(self):
+        """Endless mode: start the tower again from the ground at the start level."""
+        self.current_level = self.start_level
+        self.clear_level()
+        self.dog_spawns.reset(top_first=False)  # Spawn indices climb with the tower
+        self.streamed_platforms.clear()
+
+        ground = self.create_ground()
+        self.add_platform(ground)
+        self.streamed_platforms.append(ground)
+
+        self.platform_stream = reachable_stream(stream_platforms(
+            SCREEN_WIDTH, SCREEN_HEIGHT, level=self.start_level,
+            difficulty=self.current_difficulty, max_level=self.max_levels, rng=self.rng
+        ), GROUND_PLATFORM, self.jump_envelope)
+        self.stream_top = SCREEN_HEIGHT
+        self.stream_level()
+
+    def stream_level(self):
+        """
+        Endless mode: keep about a screen of platforms ready above the view and
+        retire the ones that dropped below it, so the number of live sprites
+        stays the same however high Kitty climbs.
+        """
+        view_top = self.camera.world_y(0)
+        while self.stream_top > view_top - SCREEN_HEIGHT:
+            level, chunk = next(self.platform_stream)
+            for p_data in chunk:
+                platform = self.platform_pool.acquire(p_data, self.branch_image, self.rng)
+                platform.level = level
+                self.add_platform(platform)
+                self.streamed_platforms.append(platform)
+                self.dog_spawns.add(platform)
+            self.stream_top = chunk[-1][1]
+
+        view_bottom = self.camera.world_y(SCREEN_HEIGHT)
+        streamed = self.streamed_platforms
+        while streamed and streamed[0].rect.top > view_bottom + 100:
+            platform = streamed.popleft()
+            self.remove_platform(platform)
+            for dog in list(self.dogs):
+                if dog.platform is platform:
+                    self.dog_pool.release(dog)
+                    self.enemy_index.remove(dog)
+            self.dog_spawns.remove(platform)
+
+    def start_new_level(self):
+        """Advance to the next level. Returns True when the last level was beaten."""
+        won = False
+        if self.current_level < self.max_levels:
+            self.current_level += 1
+        else:
+            won = True
+            self.current_level = 1
+        self.restart_current_level(regenerate=True)
+        return won
+
+    def new_game(self, lives=3, level=1):
+        self.lives = lives
+        self.current_level = level
+        self.start_level = level
+        self.restart_current_level(regenerate=True)
+
+    # ------------------ Spawning -------------------
+
+    def spawn_dog_for_difficulty(self, difficulty):
+        # Cap concurrent dogs
+        if len(self.dogs) >= max(0, difficulty):
+            return
+
+        # Only spawn on free platforms above the visible area
+        platform = self.dog_spawns.choose(self.camera.world_y(0), self.rng, self.kitty.rect)
+        if platform is not None:
+            self.add_dog(platform)
+
+    def add_dog(self, platform):
+        dog = self.dog_pool.acquire(platform, self.rng)
+        self.dogs.add(dog)
+        self.enemy_index.insert(dog)
+        self.dog_spawns.occupy(platform)
+
+    def run_spawn_table(self):
+        """Pack levels: spawn whatever the level's table schedules up to now."""
+        table = self.spawn_table
+        elapsed = self.now - self.level_start_time
+        while self.next_scripted_spawn is not None and self.next_scripted_spawn <= elapsed:
+            _, kind, index = table[self.spawn_cursor].item()
+            if kind == DOG and len(self.dogs) < self.current_difficulty:
+                # Same rules as random spawning: off screen, free and not
+                # under Kitty; a scripted platform that isn't is skipped
+                view_top = self.camera.world_y(0)
+                if index == ANY_PLATFORM:
+                    platform = self.dog_spawns.choose(view_top, self.rng, self.kitty.rect)
+                else:
+                    platform = self.pack_platforms[index]
+                    if not self.dog_spawns.allows(platform, view_top, self.kitty.rect):
+                        platform = None
+                if platform is not None:
+                    self.add_dog(platform)
+            elif kind == EAGLE:
+                self.spawn_eagle_logic()
+            self.spawn_cursor += 1
+            if self.spawn_cursor == len(table):
+                # Random spawning never lets up, so neither does the table:
+                # play it again from where it ended
+                last = int(table["time"][-1])
+                if last == 0:
+                    self.next_scripted_spawn = None  # Only spawns at the start
+                    break
+                self.spawn_cursor = 0
+                self.spawn_table_offset += last
+            self.next_scripted_spawn = self.spawn_table_offset + int(table["time"][self.spawn_cursor])
+
+    def spawn_eagle_logic(self):
+        # Cap concurrent eagles to 1 for now to avoid chaos
+        if len(self.eagles) >= 1:
+            return
+
+        eagle = self.eagle_pool.acquire(self.kitty, self.camera.offset, self.rng)
+        self.eagles.add(eagle)
+        self.enemy_index.insert(eagle)
+
+        # Schedule next spawn
+        wait_time = self.rng.randint(*EAGLE_SPAWN_INTERVAL)  # 5-10 seconds
+        self.next_eagle_spawn_time = self.now + wait_time
+
+    # ------------------ Simulation -------------------
+
+    def lose_life(self, cause):
+        """Take a life. Returns the events to report for it."""
+        self.lives -= 1
+        if self.lives > 0:
+            self.restart_current_level(regenerate=True)
+            return [cause]
+        return [cause, "game_over"]
+
+    def step(self, inputs=NO_INPUT, dt=FIXED_DT):
+        """
+        Advance the world by `dt` seconds and return a list of event names
+        ("level_complete", "game_won", "fell", "hit_dog", "hit_eagle",
+        "game_over") for the caller to present.
+        """
+        if inputs.restart:
+            self.new_game(level=self.start_level if self.endless else 1)
+
+        kitty = self.kitty
+        mark = self.profiler.mark
+        self.frame += 1
+        # Simulation clock; nothing here reads the wall clock
+        self.time_elapsed += dt
+        self.now = int(self.time_elapsed * 1000)
+
+        breeze_strength = get_breeze_strength(self.time_elapsed)
+
+        if inputs.jump:
+            kitty.do_jump(self.now)
+        if inputs.release:
+            kitty.stop_jump()
+
+        pressed_keys = {pygame.K_LEFT: inputs.left, pygame.K_RIGHT: inputs.right}
+        kitty.update(pressed_keys, self.platform_index, breeze_strength, self.now, dt)
+        mark("kitty")
+
+        # Update platforms; only the ones that moved need re-indexing
+        platform_index = self.platform_index
+        for platform in self.platform_motion.step(breeze_strength, self.time_elapsed, dt):
+            platform_index.update(platform)
+        mark("platforms")
+
+        # Camera (a view transform - world positions are left alone)
+        self.camera.follow(kitty)
+        if self.endless:
+            self.stream_level()
+        mark("camera")
+
+        self.leaves.update(breeze_strength, dt, self.camera.offset)
+        mark("leaves")
+
+        # Life Lost
+        if self.camera.screen_y(kitty.rect.top) > SCREEN_HEIGHT:
+            return self.lose_life("fell")
+
+        # Collision with Platforms
+        collisions = self.platform_index.query_rect(kitty.rect)
+        for platform in collisions:
+            if kitty.velocity >= 0 and kitty.previous_rect.bottom <= platform.rect.top and kitty.rect.bottom >= platform.rect.top:
+                kitty.falling = False
+                kitty.velocity = 0
+                kitty.rect.bottom = platform.rect.top
+
+                # Endless mode: the level is whatever chunk Kitty has reached
+                if self.endless:
+                    self.current_level = max(self.current_level, platform.level)
+
+                # Check level complete
+                if getattr(platform, 'is_final', False) and not self.level_complete:
+                    self.level_complete = True
+                    if self.start_new_level():
+                        return ["level_complete", "game_won"]
+                    return ["level_complete"]
+
+                dx, dy = self.platform_motion.delta(platform)
+                kitty.rect.x += dx
+                kitty.rect.y += dy
+                break
+        mark("collisions")
+
+        enemy_index = self.enemy_index
+        for dog in list(self.dogs):
+            dog.update(dt)
+            enemy_index.update(dog)
+
+        for eagle in list(self.eagles):
+            eagle.update(dt)
+            if eagle.alive():
+                enemy_index.update(eagle)
+            else:
+                # Flew off screen
+                enemy_index.remove(eagle)
+                self.eagle_pool.release(eagle)
+        mark("enemies")
+
+        if self.spawn_table is not None:
+            self.run_spawn_table()
+        else:
+            # Spawn dogs (Level > 3)
+            if self.current_level > 3 and self.now >= self.next_dog_spawn_time:
+                self.spawn_dog_for_difficulty(self.current_difficulty)
+                base = DOG_SPAWN_BASE.get(self.current_difficulty, 5000)
+                self.next_dog_spawn_time = self.now + self.rng.randint(int(base * 0.5), int(base * 1.5))
+
+            # Spawn eagles (Level >= 5)
+            if self.current_level >= 5 and self.now >= self.next_eagle_spawn_time:
+                self.spawn_eagle_logic()
+        mark("spawning")
+
+        # Rect broadphase, then pixel masks for the few enemies it finds
+        hits = enemy_index.query_rect(kitty.rect)
+        if hits:
+            kitty_mask = kitty.mask
+            kx, ky = kitty.rect.topleft
+            hits = [hit for hit in hits if kitty_mask.overlap(hit.mask, (hit.rect.x - kx, hit.rect.y - ky))]
+        mark("collisions")
+        if hits:
+            if any(isinstance(hit, Dog) for hit in hits):
+                return self.lose_life("hit_dog")
+            return self.lose_life("hit_eagle")
+
+        return []
+
+    def state_hash(self):
+        """
+        64-bit digest of the gameplay state (Kitty, camera, level, platforms,
+        enemies, timers). Two runs with the same seed and inputs produce the
+        same sequence of hashes. Cosmetic leaves are not included.
+        """
+        kitty = self.kitty
+        parts = [
+            self.frame, self.now, self.lives, self.current_level,
+            self.next_dog_spawn_time, self.next_eagle_spawn_time,
+            round(self.camera.offset, 6), tuple(kitty.rect), round(kitty.velocity, 6),
+            kitty.jump, kitty.falling,
+        ]
+        parts.extend(tuple(p.rect) for p in self.platforms)
+        parts.extend((tuple(d.rect), d.direction) for d in self.dogs)
+        parts.extend(tuple(e.rect) for e in self.eagles)
+        digest = hashlib.blake2b(repr(parts).encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "little")
+
+
+def scripted_inputs(frame):
+    """Simple bot input: hop every second and drift from side to side."""
+    phase = frame % 60
+    going_right = (frame // 240) % 2 == 0
+    return Inputs(not going_right, going_right, phase == 0, phase == 30)
+
+
+def run_headless(frames, level=1, difficulty=1, max_leaves=MAX_LEAVES, endless=False, seed=None,
+                 level_pack=None):
+    """Run `frames` fixed steps without a display. Returns (steps per second, world)."""
+    world = World(level=level, difficulty=difficulty, max_leaves=max_leaves, endless=endless, seed=seed,
+                  level_pack=level_pack)
+    start = time.perf_counter()
+    restart = False
+    for frame in range(frames):
+        events = world.step(scripted_inputs(frame)._replace(restart=restart))
+        restart = "game_over" in events
+    elapsed = time.perf_counter() - start
+    return frames / elapsed, world
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the Kitty simulation headless.")
+    parser.add_argument("--frames", type=int, default=10000)
+    parser.add_argument("--level", type=int, default=5)
+    parser.add_argument("--difficulty", type=int, default=2)
+    parser.add_argument("--leaves", type=int, default=MAX_LEAVES)
+    parser.add_argument("--endless", action="store_true", help="endless tower mode")
+    parser.add_argument("--seed", type=seed_arg, default=None)
+    parser.add_argument("--pack", metavar="PATH", help="play levels from a level pack (level_pack.py)")
+    args = parser.parse_args()
+
+    pack = LevelPack.open(args.pack) if args.pack else None
+    fps, world = run_headless(args.frames, args.level, args.difficulty, args.leaves, args.endless, args.seed,
+                              pack)
+    print(f"{args.frames} frames, {fps:.0f} steps/s, level {world.current_level}, lives {world.lives}, "
+          f"{len(world.platforms)} platforms, seed {world.seed}, state {world.state_hash():016x}")